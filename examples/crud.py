@@ -1,22 +1,28 @@
+import os
 from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
 from typing import Annotated
 
-from fastapi import Depends, FastAPI, status
-from pydantic import BaseModel, PositiveInt, RootModel
-from sqlalchemy import ColumnElement, String, select
+from fastapi import Depends, FastAPI, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, PositiveInt, RootModel, TypeAdapter
+from sqlalchemy import DDL, ColumnElement, Select, String, column, event, select, table
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import MultipleResultsFound
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from fastapi_batteries.crud import CRUD
 from fastapi_batteries.fastapi.exceptions import APIException, get_api_exception_handler
 from fastapi_batteries.fastapi.middlewares import QueryCountMiddleware
-from fastapi_batteries.pydantic.schemas import Paginated, PaginationOffsetLimit
+from fastapi_batteries.pydantic.schemas import Paginated, PaginatedCursor, PaginationCursor, PaginationOffsetLimit
 from fastapi_batteries.sa.mixins import MixinId
 
 
 # --- DB
+# NOTE: Mapped classes can't use `__slots__`. SQLAlchemy keeps instance state & loaded attribute values in `__dict__`
+#       and `MappedAsDataclass` doesn't accept dataclass `slots=True` option.
 class Base(DeclarativeBase, MappedAsDataclass): ...
 
 
@@ -27,20 +33,119 @@ class User(Base, MixinId):
     is_active: Mapped[bool] = mapped_column(default=True)
 
 
-engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-async_session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+# Perf: `LIKE '%...%'` can't use regular index so we maintain FTS5 table with trigram tokenizer
+#       that can serve substring search (3+ characters) via index instead of scanning the whole table.
+user_fts = table("user_fts", column("rowid"), column("first_name"))
+
+for ddl in (
+    "CREATE VIRTUAL TABLE user_fts USING fts5(first_name, content='user', content_rowid='id', tokenize='trigram')",
+    """CREATE TRIGGER user_fts_ai AFTER INSERT ON user BEGIN
+        INSERT INTO user_fts(rowid, first_name) VALUES (new.id, new.first_name);
+    END""",
+    """CREATE TRIGGER user_fts_ad AFTER DELETE ON user BEGIN
+        INSERT INTO user_fts(user_fts, rowid, first_name) VALUES ('delete', old.id, old.first_name);
+    END""",
+    """CREATE TRIGGER user_fts_au AFTER UPDATE ON user BEGIN
+        INSERT INTO user_fts(user_fts, rowid, first_name) VALUES ('delete', old.id, old.first_name);
+        INSERT INTO user_fts(rowid, first_name) VALUES (new.id, new.first_name);
+    END""",
+):
+    event.listen(User.__table__, "after_create", DDL(ddl))
+event.listen(User.__table__, "before_drop", DDL("DROP TABLE IF EXISTS user_fts"))
+
+
+def first_name_contains(value: str) -> ColumnElement[bool]:
+    return User.id.in_(select(user_fts.c.rowid).where(user_fts.c.first_name.like(f"%{value}%")))
+
+
+# Perf: We don't use `:memory:` database because each new connection would get its own empty database.
+#       With file database, pooled connections (with their aiosqlite thread & page cache) stay warm across requests.
+DB_FILE = "crud.db"
+
+# NOTE: SQLite allows only one writer at a time so we use single connection writer pool
+#       and separate read-only pool so readers aren't blocked by the writer.
+write_engine = create_async_engine(
+    f"sqlite+aiosqlite:///{DB_FILE}",
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=1,
+    max_overflow=0,
+)
+read_engine = create_async_engine(
+    f"sqlite+aiosqlite:///file:{DB_FILE}?mode=ro&uri=true",
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=os.cpu_count() or 1,
+    max_overflow=0,
+)
+
+
+def set_sqlite_pragmas(dbapi_connection: DBAPIConnection, _: ConnectionPoolEntry) -> None:
+    # Perf: Tune SQLite defaults once per connection instead of running with DELETE journal & `synchronous=FULL`
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 
+event.listen(write_engine.sync_engine, "connect", set_sqlite_pragmas)
+event.listen(read_engine.sync_engine, "connect", set_sqlite_pragmas)
 
-async def get_db() -> AsyncGenerator[AsyncSession]:
-    async with async_session_maker() as session:
+write_session_maker = async_sessionmaker(bind=write_engine, expire_on_commit=False)
+read_session_maker = async_sessionmaker(bind=read_engine, expire_on_commit=False)
+
+
+async def get_write_db() -> AsyncGenerator[AsyncSession]:
+    async with write_session_maker() as session:
+        yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession]:
+    async with read_session_maker() as session:
         yield session
 
 
-async def create_tables():
-    async with engine.begin() as conn:
+# Perf: Plain connection for read only endpoints that don't return ORM objects to skip ORM session overhead
+async def get_read_conn() -> AsyncGenerator[AsyncConnection]:
+    async with read_engine.connect() as conn:
+        yield conn
+
+
+# Dependencies shared across endpoints
+ReadDBSession = Annotated[AsyncSession, Depends(get_read_db)]
+ReadDBConnection = Annotated[AsyncConnection, Depends(get_read_conn)]
+WriteDBSession = Annotated[AsyncSession, Depends(get_write_db)]
+Pagination = Annotated[PaginationOffsetLimit, Depends(PaginationOffsetLimit)]
+CursorPagination = Annotated[PaginationCursor, Depends(PaginationCursor)]
+
+
+# NOTE: Bump this whenever models change so existing database file gets recreated on next startup
+SCHEMA_VERSION = 1
+
+
+async def create_tables() -> bool:
+    """Create tables if database schema is outdated.
+
+    Returns:
+        bool: True if tables were (re)created, False if existing schema is up to date
+
+    """
+    async with write_engine.begin() as conn:
+        # Perf: Single pragma probe instead of dropping & recreating tables (and losing page cache) on every startup
+        user_version = (await conn.exec_driver_sql("PRAGMA user_version")).scalar_one()
+        if user_version == SCHEMA_VERSION:
+            return False
+
         await conn.run_sync(Base.metadata.drop_all)
         print("--- creating tables...")
         await conn.run_sync(Base.metadata.create_all)
+        await conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    return True
 
 
 # --- Schemas
@@ -57,6 +162,10 @@ class UserBasePartial(BaseModel):
 class UserCreate(UserBase): ...
 
 
+# Perf: Parametrize generic once so pydantic builds its core schema a single time
+UserCreateList = RootModel[Sequence[UserCreate]]
+
+
 class UserPatch(UserBasePartial): ...
 
 
@@ -64,86 +173,167 @@ class UserRead(UserBase):
     id: PositiveInt
 
 
+PaginatedUserRead = Paginated[UserRead]
+user_read_adapter = TypeAdapter(UserRead)
+
+
 # --- FastAPI
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await create_tables()
-    async with async_session_maker() as db:
-        db.add_all(
-            [
-                User(first_name="John"),
-                User(first_name="Jane"),
-                User(first_name="Alice"),
-                User(first_name="Bob"),
-                User(first_name="Charlie"),
-            ],
-        )
-        await db.commit()
+    # Only seed freshly created tables, existing database file already has the data
+    if await create_tables():
+        async with write_session_maker() as db:
+            db.add_all(
+                [
+                    User(first_name="John"),
+                    User(first_name="Jane"),
+                    User(first_name="Alice"),
+                    User(first_name="Bob"),
+                    User(first_name="Charlie"),
+                ],
+            )
+            await db.commit()
     yield
 
 
+# Create the handler once & reuse it wherever `APIException` handler needs to be registered
+api_exception_handler = get_api_exception_handler()
+
 app = FastAPI(
     lifespan=lifespan,
     exception_handlers={
-        APIException: get_api_exception_handler(),
+        APIException: api_exception_handler,
     },
 )
 
-app.add_middleware(QueryCountMiddleware, engine)
+# NOTE: Reads & writes go through different engines so we count queries of both
+app.add_middleware(QueryCountMiddleware, [read_engine, write_engine])
 
 # --- CRUD
 
-user_crud = CRUD[User, UserCreate, UserPatch, BaseModel](model=User, resource_name="User")
+user_crud = CRUD[User, UserCreate, UserPatch, BaseModel](
+    model=User,
+    resource_name="User",
+    raise_on_lazy_load=True,
+)
+
+# Perf: Build base select statements once. They're immutable so each request derives its own via `.where()`
+BASE_USER_SELECT = select(User)
+BASE_USER_ID_SELECT = select(User.id)
+BASE_USER_ID_FIRST_NAME_SELECT = select(User.id, User.first_name)
+BASE_USER_FIRST_NAME_IS_ACTIVE_SELECT = select(User.first_name, User.is_active)
+
+# Perf: Reject oversized or unexpected filter values during validation before any DB connection is checked out.
+#       Max length matches the `User.first_name` column.
+FirstNameQuery = Annotated[str, Query(max_length=30)]
+FirstNameContainsQuery = Annotated[str, Query(max_length=30, pattern=r"^[A-Za-z0-9 _-]*$")]
+
+
+def user_filters(
+    *,
+    user_id: int | None = None,
+    first_name: FirstNameQuery = "",
+    first_name__contains: FirstNameContainsQuery = "",
+) -> list[ColumnElement[bool]]:
+    """Build where clauses from user filters shared across endpoints."""
+    filters: list[ColumnElement[bool]] = []
+
+    if user_id:
+        filters.append(User.id == user_id)
+    if first_name:
+        filters.append(User.first_name == first_name)
+    if first_name__contains:
+        filters.append(first_name_contains(first_name__contains))
+
+    return filters
 
 
 @app.post("/users/")
-async def create_user(user: UserCreate, db: Annotated[AsyncSession, Depends(get_db)]):
+async def create_user(user: UserCreate, db: WriteDBSession):
     return await user_crud.create(db, user)
 
 
 @app.post("/users/multi")
-async def create_users(users: RootModel[Sequence[UserCreate]], db: Annotated[AsyncSession, Depends(get_db)]):
+async def create_users(users: UserCreateList, db: WriteDBSession):
     return await user_crud.create(db, users)
 
 
-@app.get("/users/", response_model=Paginated[UserRead])
+# Perf: Pages larger than this are streamed row by row instead of materializing whole page & its JSON at once
+STREAM_USERS_LIMIT_THRESHOLD = 100
+
+
+async def stream_users(
+    select_statement: Select[tuple[int, str]],
+    pagination: PaginationOffsetLimit,
+) -> AsyncGenerator[bytes]:
+    """Stream paginated users as JSON with same shape as `PaginatedUserRead`."""
+    # NOTE: Dependencies with `yield` are closed before the response body is sent so we open our own connection
+    async with read_engine.connect() as conn:
+        total = await user_crud.count(conn, select_statement=select_statement)
+
+        yield b'{"data":['
+        result = await conn.stream(select_statement.limit(pagination.limit).offset(pagination.offset))
+        separator = b""
+        async for row in result.mappings():
+            yield separator + user_read_adapter.dump_json(user_read_adapter.validate_python(row))
+            separator = b","
+        yield b'],"meta":{"total":%d}}' % total
+
+
+@app.get("/users/", response_model=PaginatedUserRead)
 async def get_users(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    pagination: Annotated[PaginationOffsetLimit, Depends(PaginationOffsetLimit)],
-    first_name: str = "",
-    first_name__contains: str = "",
+    db: ReadDBSession,
+    pagination: Pagination,
+    first_name: FirstNameQuery = "",
+    first_name__contains: FirstNameContainsQuery = "",
 ):
-    select_statement = select(User)
+    # Perf: Only select columns required by `UserRead` instead of loading whole ORM entity
+    select_statement = BASE_USER_ID_FIRST_NAME_SELECT.where(
+        *user_filters(first_name=first_name, first_name__contains=first_name__contains),
+    )
 
-    if first_name:
-        select_statement = select_statement.where(User.first_name == first_name)
-    if first_name__contains:
-        select_statement = select_statement.where(User.first_name.contains(first_name__contains))
+    if pagination.limit > STREAM_USERS_LIMIT_THRESHOLD:
+        return StreamingResponse(stream_users(select_statement, pagination), media_type="application/json")
 
-    db_users, total = await user_crud.get_multi(
+    db_users, total = await user_crud.get_multi_for_cols(
         db,
         pagination=pagination,
-        select_statement=lambda _: select_statement,
+        select_statement=select_statement,
+        as_mappings=True,
     )
 
-    return {
-        "data": db_users,
-        "meta": {"total": total},
-    }
+    # Perf: Validate & serialize straight to JSON bytes via pydantic-core.
+    #       Otherwise FastAPI builds intermediate dict for response model & encodes it via stdlib `json`.
+    paginated_users = PaginatedUserRead.model_validate({"data": db_users, "meta": {"total": total}})
+    return Response(paginated_users.model_dump_json(), media_type="application/json")
+
+
+# Perf: Keyset pagination costs the same for every page unlike offset pagination that scans all previous rows
+@app.get("/users/cursor", response_model=PaginatedCursor[UserRead])
+async def get_users_by_cursor(
+    db: ReadDBSession,
+    pagination: CursorPagination,
+    first_name__contains: FirstNameContainsQuery = "",
+):
+    db_users, next_cursor = await user_crud.get_multi(
+        db,
+        pagination=pagination,
+        select_statement=lambda s: s.where(*user_filters(first_name__contains=first_name__contains)),
+    )
+
+    return {"data": db_users, "meta": {"next_cursor": next_cursor}}
 
 
 @app.get("/users/with-first-name-and-is-active")
 async def get_users_with_cols(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    pagination: Annotated[PaginationOffsetLimit, Depends(PaginationOffsetLimit)],
-    first_name: str = "",
-    first_name__contains: str = "",
+    db: ReadDBSession,
+    pagination: Pagination,
+    first_name: FirstNameQuery = "",
+    first_name__contains: FirstNameContainsQuery = "",
 ):
-    select_statement = select(User.first_name, User.is_active)
-    if first_name:
-        select_statement = select_statement.where(User.first_name == first_name)
-    if first_name__contains:
-        select_statement = select_statement.where(User.first_name.contains(first_name__contains))
+    select_statement = BASE_USER_FIRST_NAME_IS_ACTIVE_SELECT.where(
+        *user_filters(first_name=first_name, first_name__contains=first_name__contains),
+    )
 
     db_users, total = await user_crud.get_multi_for_cols(
         db,
@@ -160,38 +350,32 @@ async def get_users_with_cols(
 
 @app.get("/users/count")
 async def get_users_count(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    first_name: str = "",
-    first_name__contains: str = "",
+    db: ReadDBConnection,
+    first_name: FirstNameQuery = "",
+    first_name__contains: FirstNameContainsQuery = "",
 ):
-    select_statement = select(User)
-    if first_name:
-        select_statement = select_statement.where(User.first_name == first_name)
-    if first_name__contains:
-        select_statement = select_statement.where(User.first_name.contains(first_name__contains))
+    select_statement = BASE_USER_SELECT.where(
+        *user_filters(first_name=first_name, first_name__contains=first_name__contains),
+    )
 
-    return await user_crud.count(db, select_statement=lambda _: select_statement)
+    return await user_crud.count(db, select_statement=select_statement)
 
 
 @app.get("/users/one")
 async def get_one_user(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: ReadDBSession,
     user_id: PositiveInt | None = None,
-    first_name: str = "",
-    first_name__contains: str = "",
+    first_name: FirstNameQuery = "",
+    first_name__contains: FirstNameContainsQuery = "",
 ):
-    select_statement = select(User)
-    if user_id:
-        select_statement = select_statement.where(User.id == user_id)
-    if first_name:
-        select_statement = select_statement.where(User.first_name == first_name)
-    if first_name__contains:
-        select_statement = select_statement.where(User.first_name.contains(first_name__contains))
+    select_statement = BASE_USER_SELECT.where(
+        *user_filters(user_id=user_id, first_name=first_name, first_name__contains=first_name__contains),
+    )
 
     try:
         return await user_crud.get_one_or_404(
             db,
-            select_statement=lambda _: select_statement,
+            select_statement=select_statement,
             msg_multiple_results_exc="Multiple users found",
         )
     except MultipleResultsFound as e:
@@ -203,15 +387,13 @@ async def get_one_user(
 
 @app.get("/users/one/with-first-name-and-is-active", response_model=UserRead)
 async def get_user_with_cols(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    first_name: str = "",
-    first_name__contains: str = "",
+    db: ReadDBSession,
+    first_name: FirstNameQuery = "",
+    first_name__contains: FirstNameContainsQuery = "",
 ):
-    select_statement = select(User.first_name, User.id)
-    if first_name:
-        select_statement = select_statement.where(User.first_name == first_name)
-    if first_name__contains:
-        select_statement = select_statement.where(User.first_name.contains(first_name__contains))
+    select_statement = BASE_USER_ID_FIRST_NAME_SELECT.where(
+        *user_filters(first_name=first_name, first_name__contains=first_name__contains),
+    )
 
     return await user_crud.get_one_for_cols_or_404(
         db,
@@ -223,63 +405,50 @@ async def get_user_with_cols(
 
 @app.get("/users/exist")
 async def user_exist(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: ReadDBConnection,
     user_id: PositiveInt | None = None,
-    first_name: str = "",
-    first_name__contains: str = "",
+    first_name: FirstNameQuery = "",
+    first_name__contains: FirstNameContainsQuery = "",
 ):
-    select_statement = select(User)
-    if user_id:
-        select_statement = select_statement.where(User.id == user_id)
-    if first_name:
-        select_statement = select_statement.where(User.first_name == first_name)
-    if first_name__contains:
-        select_statement = select_statement.where(User.first_name.contains(first_name__contains))
+    select_statement = BASE_USER_ID_SELECT.where(
+        *user_filters(user_id=user_id, first_name=first_name, first_name__contains=first_name__contains),
+    )
 
-    return await user_crud.exist(db, select_statement=lambda _: select_statement)
+    return await user_crud.exist(db, select_statement=select_statement)
 
 
 @app.get("/users/exist_n")
 async def user_exist_n(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: ReadDBConnection,
     n: int,
     user_id: PositiveInt | None = None,
-    first_name: str = "",
-    first_name__contains: str = "",
+    first_name: FirstNameQuery = "",
+    first_name__contains: FirstNameContainsQuery = "",
 ):
-    select_statement = select(User)
-    if user_id:
-        select_statement = select_statement.where(User.id == user_id)
-    if first_name:
-        select_statement = select_statement.where(User.first_name == first_name)
-    if first_name__contains:
-        select_statement = select_statement.where(User.first_name.contains(first_name__contains))
+    select_statement = BASE_USER_ID_SELECT.where(
+        *user_filters(user_id=user_id, first_name=first_name, first_name__contains=first_name__contains),
+    )
 
-    return await user_crud.exist_n(db, select_statement=lambda _: select_statement, n=n)
+    return await user_crud.exist_n(db, select_statement=select_statement, n=n)
 
 
 @app.get("/users/{user_id}")
-async def get_user(user_id: PositiveInt, db: Annotated[AsyncSession, Depends(get_db)]):
+async def get_user(user_id: PositiveInt, db: ReadDBSession):
     return await user_crud.get_or_404(db, user_id)
 
 
 @app.patch("/users/{user_id}")
-async def patch_user(user_id: PositiveInt, user: UserPatch, db: Annotated[AsyncSession, Depends(get_db)]):
+async def patch_user(user_id: PositiveInt, user: UserPatch, db: WriteDBSession):
     return await user_crud.patch(db, item_id=user_id, patched_item=user)
 
 
 @app.patch("/users/")
 async def patch_users_with_first_name(
     user: UserPatch,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    first_name: str = "",
-    first_name__contains: str = "",
+    db: WriteDBSession,
+    first_name: FirstNameQuery = "",
+    first_name__contains: FirstNameContainsQuery = "",
 ):
-    where: set[ColumnElement[bool]] = set()
-
-    if first_name:
-        where.add(User.first_name == first_name)
-    if first_name__contains:
-        where.add(User.first_name.contains(first_name__contains))
+    where = set(user_filters(first_name=first_name, first_name__contains=first_name__contains))
 
     return await user_crud.patch_where(db, where=where, patched_item=user)
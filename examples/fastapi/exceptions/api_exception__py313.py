@@ -2,9 +2,11 @@ from fastapi import FastAPI, status
 
 from fastapi_batteries.fastapi.exceptions import APIException, get_api_exception_handler
 
+api_exception_handler = get_api_exception_handler()
+
 app = FastAPI()
 
-app.add_exception_handler(APIException, get_api_exception_handler())
+app.add_exception_handler(APIException, api_exception_handler)
 
 
 @app.get("/raises-exception/")
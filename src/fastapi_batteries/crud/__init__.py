@@ -1,32 +1,178 @@
-from collections.abc import Callable, Mapping, Sequence, Set
+from collections.abc import AsyncIterator, Callable, Mapping, MutableMapping, Sequence, Set
 from contextlib import suppress
+from functools import cache
 from logging import Logger
-from typing import Any, Literal, overload
+from typing import Any, Literal, get_args, overload
 
 from fastapi import status
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel, RootModel, TypeAdapter
 from sqlalchemy import (
+    Column,
     ColumnElement,
     RowMapping,
-    ScalarResult,
     Select,
+    Table,
+    TableClause,
+    bindparam,
+    column,
     delete,
     exists,
     func,
     insert,
+    inspect,
+    literal,
     select,
+    table,
+    text,
+    tuple_,
     update,
 )
+from sqlalchemy.dialects.postgresql import Insert as PGInsert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import MultipleResultsFound
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute, Load, Mapper, raiseload
 
 from fastapi_batteries.fastapi.exceptions import APIException
-from fastapi_batteries.pydantic.schemas import PaginationOffsetLimit, PaginationPageSize
-from fastapi_batteries.utils.pagination import page_size_to_offset_limit
+from fastapi_batteries.pydantic.schemas import PaginationCursor, PaginationOffsetLimit, PaginationPageSize
+from fastapi_batteries.utils.pagination import decode_cursor, encode_cursor, page_size_to_offset_limit
 
 type RecordsWithCount[T] = tuple[T, int]
+type RecordsWithCursor[T] = tuple[T, str | None]
+
+# Select statement as it is or function that modifies the default select statement (e.g. add where clause)
+type SelectStatement[T: tuple[Any, ...]] = Select[T] | Callable[[Select[T]], Select[T]]
+
+
+def _identity[T](statement: T) -> T:
+    """Default select statement modifier that returns the default select statement as it is."""
+    return statement
+
+
+def _resolve_select_statement[T: tuple[Any, ...]](
+    select_statement: Select[T] | Callable[[Select[Any]], Select[T]],
+    base_statement: Select[Any],
+) -> Select[T]:
+    # Perf: Default modifier doesn't change anything so we directly use the (prebuilt) default select statement
+    if select_statement is _identity:
+        return base_statement
+
+    # Perf: Select statements are used as they are, only functions are invoked with the default select statement
+    return select_statement(base_statement) if callable(select_statement) else select_statement
+
+
+def _is_distinct(statement: Select[Any]) -> bool:
+    # NOTE: `DISTINCT ON` also sets `_distinct` but we check both to not rely on it
+    return bool(statement._distinct or statement._distinct_on)  # noqa: SLF001
+
+
+def _can_count_directly(statement: Select[Any]) -> bool:
+    """Check if rows of select statement can be counted via plain aggregate over its FROM & WHERE."""
+    # NOTE: Rows can't be counted directly if they're grouped, deduped, limited or projected via SQL expressions
+    #       (e.g. aggregate or window function)
+    if (
+        statement._group_by_clauses  # noqa: SLF001
+        or statement._having_criteria  # noqa: SLF001
+        or _is_distinct(statement)
+        or statement._limit_clause is not None  # noqa: SLF001
+        or statement._offset_clause is not None  # noqa: SLF001
+        or not all(isinstance(col, Column) for col in statement.selected_columns)
+    ):
+        return False
+
+    # NOTE: ORM adds criteria while compiling (e.g. `with_loader_criteria` option, single table inheritance
+    #       discriminator, criteria of joined entities) which aren't part of statement's WHERE clause.
+    #       Only loader strategy options (e.g. `selectinload`) are known to not affect rows.
+    if any(not (isinstance(option, Load) or hasattr(option, "strategy")) for option in statement._with_options):  # noqa: SLF001
+        return False
+    if not all(isinstance(from_, Table) for from_ in statement.get_final_froms()):
+        return False
+
+    for desc in statement.column_descriptions:
+        insp = inspect(desc["entity"], raiseerr=False) if desc["entity"] is not None else None
+        mapper = getattr(insp, "mapper", None)
+        if mapper is not None and (mapper.inherits is not None or mapper.polymorphic_on is not None):
+            return False
+
+    return True
+
+
+def _count_statement(statement: Select[Any]) -> Select[tuple[int]]:
+    """Build statement counting rows of given select statement."""
+    # Count rows of the subquery when statement's rows can't be counted directly
+    if not _can_count_directly(statement):
+        return select(func.count()).select_from(statement.subquery())
+
+    # Perf: Plain aggregate over same FROM & WHERE lets DB use index only scan instead of evaluating subquery
+    count_statement = select(func.count()).select_from(*statement.get_final_froms())
+    if statement.whereclause is not None:
+        count_statement = count_statement.where(statement.whereclause)
+    return count_statement
+
+
+@cache
+def _has_joined_load(mapper: Mapper[Any]) -> bool:
+    """Check if loading mapper's entities joined eager loads any relationship (`lazy="joined"`)."""
+    # NOTE: Joined scalar relationship's target can join its own collections in the same query, so we treat any
+    #       joined relationship as possible source of duplicate rows instead of relying on walking every path.
+    #       Subclasses are included as polymorphic loading can join their relationships as well.
+    # NOTE: `lazy=False` is legacy alias of `lazy="joined"`
+    return any(
+        rel.lazy in ("joined", False) for current in mapper.self_and_descendants for rel in current.relationships
+    )
+
+
+def _needs_unique(statement: Select[Any]) -> bool:
+    """Check if rows of statement may need to be deduped because of joined eager loading.
+
+    Rows are only left as they are when statement provably has no joined eager load, otherwise we dedupe to be safe.
+    """
+    for option in statement._with_options:  # noqa: SLF001
+        if isinstance(option, Load):
+            strategies = [element.strategy for element in option.context]
+        # Wildcard loader options like `raiseload("*")` carry strategy directly
+        elif hasattr(option, "strategy"):
+            strategies = [option.strategy]
+        # NOTE: We can't tell what unknown options do so we play safe & dedupe
+        else:
+            return True
+
+        if any(("lazy", "joined") in (strategy or ()) for strategy in strategies):
+            return True
+
+    # Relationships configured with `lazy="joined"` are eager loaded without any option
+    # NOTE: Aliased entities are inspected as `AliasedInsp` so we take mapper from it
+    return any(
+        (mapper := getattr(inspect(desc["entity"], raiseerr=False), "mapper", None)) is not None
+        and _has_joined_load(mapper)
+        for desc in statement.column_descriptions
+        if desc["entity"] is not None
+    )
+
+
+@cache
+def _type_adapter(python_type: type) -> TypeAdapter[Any]:
+    return TypeAdapter(python_type)
+
+
+def _dump_root_list(root_model: RootModel[Sequence[BaseModel]]) -> list[dict[str, Any]]:
+    """Dump items of root model wrapping sequence of models as list of dicts."""
+    # Perf: Serializer of `list[Item]` dumps items ~2x faster than root model's `Sequence[Item]` serializer
+    item_types = get_args(type(root_model).model_fields["root"].annotation)
+    if len(item_types) != 1:
+        return root_model.model_dump(mode="python", warnings=False)
+
+    return _type_adapter(list[item_types[0]]).dump_python(root_model.root, mode="python", warnings=False)
+
+
+def _coerce_cursor_value(attr: InstrumentedAttribute[Any], value: Any) -> Any:  # noqa: ANN401
+    # NOTE: Cursor is JSON so values like datetime come back as string & need to be converted to column's type
+    try:
+        python_type = attr.type.python_type
+    except NotImplementedError:
+        return value
+
+    return _type_adapter(python_type).validate_python(value)
 
 
 class CRUD[
@@ -42,25 +188,87 @@ class CRUD[
         soft_delete_col_name: Column name that represents soft delete
         resource_name: Resource name for error messages
         logger: Logger instance to log messages
+        raise_on_lazy_load: Whether to raise on lazy loading relationships of fetched items.
+            Helps to catch N+1 queries early. Use eager loading like `selectinload` for required relationships.
+        count_cache: Cache (e.g. `cachetools.TTLCache`) to store `count` results in. Expiry is left to the cache.
+            It's cleared after every write & again after commit. With `commit=False`, call `invalidate_count_cache`
+            after committing the transaction yourself.
+        count_cache_min_total: Only totals greater than or equal to this are cached. Small totals are cheap to
+            count again & stale small totals are most noticeable (e.g. list of few items). Defaults to 0.
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         model: type[ModelType],
         *,
         soft_delete_col_name: str = "is_deleted",
         resource_name: str = "Resource",
         logger: Logger | None = None,
+        raise_on_lazy_load: bool = False,
+        count_cache: MutableMapping[str, int] | None = None,
+        count_cache_min_total: int = 0,
     ) -> None:
         self.model = model
         self.soft_delete_col_name = soft_delete_col_name
         self.resource_name = resource_name
 
+        # Perf: Format 404 message once & reference it directly instead of dict lookup on each not found response
+        self._msg_404 = f"{self.resource_name} not found"
         self.err_messages = {
-            404: f"{self.resource_name} not found",
+            404: self._msg_404,
         }
         self.logger = logger
+        self.raise_on_lazy_load = raise_on_lazy_load
+
+        # Perf: Optional cache (e.g. `cachetools.TTLCache`) for `count` results so paging through same filters
+        #       doesn't count same rows again. It's cleared on every write made via this CRUD instance.
+        self.count_cache = count_cache
+        self.count_cache_min_total = count_cache_min_total
+
+        # Perf: Model's columns don't change at runtime so we compute them once instead of on every call
+        mapper = model.__mapper__
+        self._pk_keys = tuple(col.key for col in mapper.primary_key)
+        self._pk_attrs = tuple(mapper.get_property_by_column(col).class_attribute for col in mapper.primary_key)
+        self._updatable_keys = tuple(col.key for col in mapper.columns if col.key not in self._pk_keys)
+        self._all_column_keys = frozenset(mapper.columns.keys())
+        self._has_id = hasattr(model, "id")
+        self._column_names = {col.key: col.name for col in model.__table__.columns}
+        self._python_default_keys = frozenset(col.key for col in model.__table__.columns if col.default is not None)
+
+        # Perf: Default select statement is immutable so we build it once & derive from it on each call
+        self._base_select = select(model)
+        self._exists_base = select(literal(1)).select_from(model)
+        self._exists_statement = select(exists(self._exists_base))
+        # NOTE: Built via same checks as on-demand count so ORM criteria (e.g. inheritance discriminator) are kept
+        self._count_statement = _count_statement(self._base_select)
+        self._insert_statement = insert(model)
+        self._insert_returning_statement = insert(model).returning(model, sort_by_parameter_order=True)
+
+        # Perf: Statements that only differ by item ID are built once & ID is passed as bound parameter on execution
+        if self._has_id:
+            # NOTE: Session can't evaluate bound parameter in Python to sync deleted object so we let it
+            #       fetch deleted primary keys (via `RETURNING` where supported) in the same statement.
+            self._delete_by_id_statement = (
+                delete(model)
+                .where(model.id == bindparam("item_id"))  # type: ignore We already checked if model has `id` attribute
+                .execution_options(synchronize_session="fetch")
+            )
+            self._soft_delete_by_id_statement = (
+                update(model)
+                .where(model.id == bindparam("item_id"))  # type: ignore We already checked if model has `id` attribute
+                .values({soft_delete_col_name: True})
+                .returning(model)
+                .execution_options(synchronize_session="fetch")
+            )
+            # Perf: Expanding parameter keeps statement same for any number of IDs so it's compiled only once
+            self._get_many_statement = select(model).where(
+                model.id.in_(bindparam("item_ids", expanding=True)),  # type: ignore We already checked if model has `id` attribute
+            )
+
+    def _with_lazy_load_guard[T: tuple[Any, ...]](self, statement: Select[T]) -> Select[T]:
+        # NOTE: Eager loading options provided in statement (e.g. `selectinload`) take precedence over wildcard
+        return statement.options(raiseload("*")) if self.raise_on_lazy_load else statement
 
     @overload
     async def create(
@@ -90,6 +298,8 @@ class CRUD[
         *,
         commit: bool = True,
         returning: Literal[True] = True,
+        copy_threshold: int | None = None,
+        fast_bulk: bool = False,
     ) -> Sequence[ModelType]: ...
 
     @overload
@@ -100,16 +310,20 @@ class CRUD[
         *,
         commit: bool = True,
         returning: Literal[False],
+        copy_threshold: int | None = None,
+        fast_bulk: bool = False,
     ) -> None: ...
 
     # TOOD: Only use db as position arg and rest of param should be keyword only
-    async def create(
+    async def create(  # noqa: PLR0913
         self,
         db: AsyncSession,
         new_data: SchemaCreate | RootModel[Sequence[SchemaCreate]],
         *,
         commit: bool = True,
         returning: bool = True,
+        copy_threshold: int | None = None,
+        fast_bulk: bool = False,
     ) -> Sequence[ModelType] | ModelType | None:
         """Create single or multiple items using insert statement.
 
@@ -118,42 +332,100 @@ class CRUD[
             new_data: New data to insert in the database
             commit: Whether to commit the transaction
             returning: Whether to return the inserted item(s) via `returning` clause
+            copy_threshold: Minimum number of items to insert them via `COPY` instead of `INSERT` (only with asyncpg
+                driver & when `returning` is False). `COPY` is skipped for columns whose values are converted by
+                SQLAlchemy (e.g. JSON, Enum, `TypeDecorator`) or have Python side default but are missing in data.
+                Defaults to None which always uses `INSERT`.
+            fast_bulk: Whether to turn off `synchronous_commit` for the transaction (only with PostgreSQL) so commit
+                doesn't wait for WAL flush. Committed items can be lost if server crashes right after commit but
+                database stays consistent. Defaults to False.
 
         Returns:
             Inserted item(s) if `returning` is True else None
 
         """
+        if isinstance(new_data, RootModel):
+            return await self._create_many(
+                db,
+                new_data,
+                commit=commit,
+                returning=returning,
+                copy_threshold=copy_threshold,
+                fast_bulk=fast_bulk,
+            )
+        return await self._create_one(db, new_data, commit=commit, returning=returning)
+
+    async def _create_one(
+        self,
+        db: AsyncSession,
+        new_data: SchemaCreate,
+        *,
+        commit: bool,
+        returning: bool,
+    ) -> ModelType | None:
         # ! Don't use `jsonable_encoder`` because it can cause issue like converting datetime to string.
         # Converting date to string will cause error when inserting to database.
-        statement = insert(self.model).values(new_data.model_dump())
+        # Perf: Dump in python mode so native values (datetime, Decimal, etc.) go to DBAPI's encoders as they are
+        #       & skip serialization warnings checks as we don't need them while inserting.
+        # Perf: Data is passed as parameters to prebuilt statement instead of building new statement with `values`
+        params = new_data.model_dump(mode="python", warnings=False)
 
         if returning:
-            statement = statement.returning(self.model)
+            result = await db.scalar(self._insert_returning_statement, params)
+            await self._commit_write(db, commit=commit)
 
-            # If multiple items are provided use `scalars` else use `scalar`
-            if isinstance(new_data, RootModel):
-                result = await db.scalars(statement)
-            else:
-                result = await db.scalar(statement)
+            return result
 
-            if commit:
-                await db.commit()
+        # If returning is False
+        await db.execute(self._insert_statement, params)
+        await self._commit_write(db, commit=commit)
+        return None
 
-            """
-            If result is `ScalarResult` then we need to call `all()` to get the list of items.
-            If result is not `ScalarResult` then we can return the result as it is.
+    async def _create_many(  # noqa: PLR0913
+        self,
+        db: AsyncSession,
+        new_data: RootModel[Sequence[SchemaCreate]],
+        *,
+        commit: bool,
+        returning: bool,
+        copy_threshold: int | None,
+        fast_bulk: bool,
+    ) -> Sequence[ModelType] | None:
+        rows = _dump_root_list(new_data)
+
+        # NOTE: Executing with empty parameters list would insert a single row with default values
+        if not rows:
+            return [] if returning else None
+
+        if fast_bulk:
+            await self._disable_synchronous_commit(db)
+
+        # Perf: `COPY` checks locks, permissions & types once for whole batch instead of per row.
+        #       It can't return inserted rows so `returning` always goes via `INSERT`.
+        if (
+            not returning
+            and copy_threshold is not None
+            and len(rows) >= copy_threshold
+            # NOTE: `COPY` bypasses SQLAlchemy so Python side defaults of columns missing in payload won't be applied
+            and self._python_default_keys.issubset(rows[0].keys())
+            and self._can_copy(db, rows)
+        ):
+            await self._copy_records(db, self.model.__table__, rows)
+            await self._commit_write(db, commit=commit)
+            return None
+
+        # Perf: Pass rows as parameters (executemany) to prebuilt statement instead of rendering huge VALUES clause.
+        #       SQLAlchemy batches them via "insertmanyvalues" within DB's bind parameters limit.
+        if returning:
+            result = await db.scalars(self._insert_returning_statement, rows)
+            records = result.all()
+            await self._commit_write(db, commit=commit)
 
-            NOTE: We can determine same thing via `isinstance(new_data, RootModel)`
-                  but mypy won't be aware of result type.
-            """
-            if isinstance(result, ScalarResult):
-                return result.all()
-            return result
+            return records
 
         # If returning is False
-        await db.execute(statement)
-        if commit:
-            await db.commit()
+        await db.execute(self._insert_statement, rows)
+        await self._commit_write(db, commit=commit)
         return None
 
     # TODO: Type hint Any
@@ -163,6 +435,9 @@ class CRUD[
         item_id: int,
         **kwargs: Any,  # noqa: ANN401
     ) -> ModelType | None:
+        if self.raise_on_lazy_load:
+            kwargs["options"] = [*kwargs.get("options", ()), raiseload("*")]
+
         return await db.get(self.model, item_id, **kwargs)
 
     # TODO: Type hint Any
@@ -174,14 +449,78 @@ class CRUD[
         msg_404: str | None = None,
         **kwargs: Any,  # noqa: ANN401
     ) -> ModelType:
-        if result := await db.get(self.model, item_id, **kwargs):
+        if result := await self.get(db, item_id, **kwargs):
             return result
 
         raise APIException(
             status=status.HTTP_404_NOT_FOUND,
-            title=msg_404 or self.err_messages[404],
+            title=msg_404 or self._msg_404,
         )
 
+    async def get_many(
+        self,
+        db: AsyncSession,
+        item_ids: Sequence[int],
+    ) -> dict[int, ModelType]:
+        """Get multiple items by IDs in single query.
+
+        Args:
+            db: SQLAlchemy AsyncSession
+            item_ids: IDs of items to fetch
+
+        Returns:
+            Found items keyed by their ID. IDs that don't exist are missing from the result.
+
+        Raises:
+            AttributeError: If model does not have `id` attribute
+
+        """
+        if not self._has_id:
+            msg = f"Model {self.model.__name__} must have 'id' attribute"
+            raise AttributeError(msg)
+
+        # NOTE: `IN ()` can't match anything so we skip the query
+        if not item_ids:
+            return {}
+
+        # Perf: Single `IN` query instead of round-trip per item
+        statement = self._with_lazy_load_guard(self._get_many_statement)
+        result = await db.scalars(statement, {"item_ids": list(item_ids)})
+        records = (result.unique() if _needs_unique(statement) else result).all()
+        return {record.id: record for record in records}  # type: ignore We already checked if model has `id` attribute
+
+    async def get_many_or_404(
+        self,
+        db: AsyncSession,
+        item_ids: Sequence[int],
+        *,
+        msg_404: str | None = None,
+    ) -> dict[int, ModelType]:
+        """Get multiple items by IDs in single query or raise 404 if any of them doesn't exist.
+
+        Args:
+            db: SQLAlchemy AsyncSession
+            item_ids: IDs of items to fetch
+            msg_404: Message to use in 404 response. Defaults to message of the CRUD instance.
+
+        Returns:
+            Found items keyed by their ID
+
+        Raises:
+            APIException: If any of the items is not found. Missing IDs are listed in `missing_ids` extension.
+
+        """
+        records = await self.get_many(db, item_ids)
+
+        if missing_ids := [item_id for item_id in dict.fromkeys(item_ids) if item_id not in records]:
+            raise APIException(
+                status=status.HTTP_404_NOT_FOUND,
+                title=msg_404 or self._msg_404,
+                extensions={"missing_ids": missing_ids},
+            )
+
+        return records
+
     """
         - `pagination` is None
     """
@@ -192,7 +531,9 @@ class CRUD[
         db: AsyncSession,
         *,
         pagination: None = None,
-        select_statement: Callable[[Select[tuple[ModelType]]], Select[tuple[ModelType]]] = lambda s: s,
+        select_statement: SelectStatement[tuple[ModelType]] = _identity,
+        dedupe: bool | None = None,
+        order_by: Sequence[InstrumentedAttribute[Any]] = (),
     ) -> Sequence[ModelType]: ...
 
     """
@@ -205,40 +546,174 @@ class CRUD[
         db: AsyncSession,
         *,
         pagination: PaginationOffsetLimit | PaginationPageSize,
-        select_statement: Callable[[Select[tuple[ModelType]]], Select[tuple[ModelType]]] = lambda s: s,
+        select_statement: SelectStatement[tuple[ModelType]] = _identity,
+        dedupe: bool | None = None,
+        order_by: Sequence[InstrumentedAttribute[Any]] = (),
     ) -> RecordsWithCount[Sequence[ModelType]]: ...
 
+    """
+        - `pagination` is cursor
+    """
+
+    @overload
     async def get_multi(
         self,
         db: AsyncSession,
         *,
-        pagination: PaginationPageSize | PaginationOffsetLimit | None = None,
-        select_statement: Callable[[Select[tuple[ModelType]]], Select[tuple[ModelType]]] = lambda s: s,
-    ) -> Sequence[ModelType] | RecordsWithCount[Sequence[ModelType]]:
+        pagination: PaginationCursor,
+        select_statement: SelectStatement[tuple[ModelType]] = _identity,
+        dedupe: bool | None = None,
+        order_by: Sequence[InstrumentedAttribute[Any]] = (),
+    ) -> RecordsWithCursor[Sequence[ModelType]]: ...
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        pagination: PaginationPageSize | PaginationOffsetLimit | PaginationCursor | None = None,
+        select_statement: SelectStatement[tuple[ModelType]] = _identity,
+        dedupe: bool | None = None,
+        order_by: Sequence[InstrumentedAttribute[Any]] = (),
+    ) -> Sequence[ModelType] | RecordsWithCount[Sequence[ModelType]] | RecordsWithCursor[Sequence[ModelType]]:
         # --- Initialize statements
-        _select_statement = select_statement(select(self.model))
-        paginated_statement: Select[tuple[ModelType]] | None = None
+        _select_statement = self._with_lazy_load_guard(_resolve_select_statement(select_statement, self._base_select))
+        if dedupe is None:
+            dedupe = _needs_unique(_select_statement)
 
-        # --- Pagination
-        if pagination:
-            if isinstance(pagination, PaginationPageSize):
-                offset, limit = page_size_to_offset_limit(page=pagination.page, size=pagination.size)
-            else:
-                offset, limit = pagination.offset, pagination.limit
+        # --- Keyset pagination
+        if isinstance(pagination, PaginationCursor):
+            return await self._get_multi_keyset(
+                db,
+                pagination=pagination,
+                select_statement=_select_statement,
+                dedupe=dedupe,
+                order_by=order_by,
+            )
 
-            paginated_statement = _select_statement.limit(limit).offset(offset)
+        # NOTE: Ordering columns are applied after ordering of the statement (if any)
+        if order_by:
+            _select_statement = _select_statement.order_by(*order_by)
 
-        # --- Fetch records
-        result = await db.scalars(
-            paginated_statement if paginated_statement is not None else _select_statement,
+        # --- Fetch records without pagination
+        if not pagination:
+            result = await db.scalars(_select_statement)
+            return (result.unique() if dedupe else result).all()
+
+        # --- Pagination
+        if isinstance(pagination, PaginationPageSize):
+            offset, limit = page_size_to_offset_limit(page=pagination.page, size=pagination.size)
+        else:
+            offset, limit = pagination.offset, pagination.limit
+
+        # NOTE: Window function is evaluated before `DISTINCT` so it would also count duplicate rows.
+        #       Hence, we count deduped rows separately.
+        if _is_distinct(_select_statement):
+            result = await db.scalars(_select_statement.limit(limit).offset(offset))
+            records = (result.unique() if dedupe else result).all()
+            return records, await self.count(db, select_statement=_select_statement)
+
+        # Perf: Fetch total along with records via `COUNT(*) OVER()` to avoid separate COUNT query
+        paginated_statement = (
+            _select_statement.add_columns(func.count().over().label("total")).limit(limit).offset(offset)
         )
-        records = result.unique().all()
+
+        # --- Fetch records
+        # Perf: Only dedupe rows when needed (e.g. `joinedload` of collection) to skip hashing each row
+        result = await db.execute(paginated_statement)
+        rows = (result.unique() if dedupe else result).all()
+        records = [row[0] for row in rows]
 
         # --- Return records
-        if pagination:
-            total = await self.count(db, select_statement=lambda _: _select_statement)
-            return records, total
-        return records
+        if rows:
+            return records, rows[0][-1]
+
+        # NOTE: Window function can't tell total for page that is out of range so we have to count separately
+        total = await self.count(db, select_statement=_select_statement) if offset else 0
+        return records, total
+
+    async def _get_multi_keyset(
+        self,
+        db: AsyncSession,
+        *,
+        pagination: PaginationCursor,
+        select_statement: Select[tuple[ModelType]],
+        dedupe: bool,
+        order_by: Sequence[InstrumentedAttribute[Any]],
+    ) -> RecordsWithCursor[Sequence[ModelType]]:
+        # NOTE: Cursor is built from ordering columns so ordering must be given via `order_by` & not via statement
+        if select_statement._order_by_clauses:  # noqa: SLF001
+            msg = "Pass ordering via `order_by` instead of ordering the select statement with cursor pagination"
+            raise ValueError(msg)
+
+        # NOTE: Cursor values are read from fetched records so ordering columns must belong to the model
+        if invalid_attrs := [attr.key for attr in order_by if not issubclass(self.model, attr.class_)]:
+            msg = f"`order_by` columns must belong to {self.model.__name__} with cursor pagination: {invalid_attrs}"
+            raise ValueError(msg)
+
+        # NOTE: Primary key is always last ordering column so ordering is unique & no row is skipped or repeated.
+        #       Ordering columns must not be nullable as `NULL` can't be compared.
+        keyset_attrs = (*order_by, *self._pk_attrs)
+
+        # Perf: Fetch one extra record to know if there's next page without separate COUNT query
+        statement = select_statement.order_by(*keyset_attrs).limit(pagination.size + 1)
+
+        if pagination.cursor:
+            try:
+                values = decode_cursor(pagination.cursor)
+                if len(values) != len(keyset_attrs):
+                    msg = "Invalid cursor"
+                    raise ValueError(msg)  # noqa: TRY301
+                values = [_coerce_cursor_value(attr, value) for attr, value in zip(keyset_attrs, values, strict=True)]
+            except ValueError as e:
+                raise APIException(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    title="Invalid cursor",
+                ) from e
+
+            # Perf: Row value comparison lets DB seek directly to next page via index instead of scanning with OFFSET
+            statement = statement.where(tuple_(*keyset_attrs) > tuple_(*values))
+
+        result = await db.scalars(statement)
+        records = (result.unique() if dedupe else result).all()
+
+        if len(records) <= pagination.size:
+            return records, None
+
+        records = records[: pagination.size]
+        return records, encode_cursor([getattr(records[-1], attr.key) for attr in keyset_attrs])
+
+    async def get_multi_stream(
+        self,
+        db: AsyncSession,
+        *,
+        select_statement: SelectStatement[tuple[ModelType]] = _identity,
+        yield_per: int = 1000,
+    ) -> AsyncIterator[ModelType]:
+        """Stream records for given select statement in chunks instead of loading all of them at once.
+
+        Useful for large results (e.g. exports) where `get_multi` without pagination would hold every record in memory.
+        Records must be consumed while `db` is still open, e.g. inside endpoint or `StreamingResponse` generator that
+        owns the session.
+
+        Args:
+            db: SQLAlchemy AsyncSession
+            select_statement: Select statement or function to modify the default select statement
+            yield_per: Number of records to fetch from DB per chunk
+
+        Yields:
+            Queried records one by one
+
+        """
+        _select_statement = self._with_lazy_load_guard(_resolve_select_statement(select_statement, self._base_select))
+
+        # Perf: Server side cursor keeps only `yield_per` records in memory at a time
+        result = await db.stream_scalars(_select_statement.execution_options(yield_per=yield_per))
+        try:
+            async for record in result:
+                yield record
+        finally:
+            # NOTE: Consumer can stop early (e.g. client disconnected) so we release the server side cursor right away
+            await result.close()
 
     """
         - `pagination` is None
@@ -253,6 +728,8 @@ class CRUD[
         pagination: None = None,
         select_statement: Select[tuple[*T]],
         as_mappings: Literal[False] = False,
+        dedupe: bool | None = None,
+        check_all_cols: bool = True,
     ) -> Sequence[tuple[*T]]: ...
 
     """
@@ -268,6 +745,8 @@ class CRUD[
         pagination: None = None,
         select_statement: Select[tuple[*T]],
         as_mappings: Literal[True],
+        dedupe: bool | None = None,
+        check_all_cols: bool = True,
     ) -> Sequence[RowMapping]: ...
 
     """
@@ -283,6 +762,8 @@ class CRUD[
         pagination: PaginationOffsetLimit | PaginationPageSize,
         select_statement: Select[tuple[*T]],
         as_mappings: Literal[False] = False,
+        dedupe: bool | None = None,
+        check_all_cols: bool = True,
     ) -> RecordsWithCount[Sequence[tuple[*T]]]: ...
 
     """
@@ -298,62 +779,103 @@ class CRUD[
         pagination: PaginationOffsetLimit | PaginationPageSize,
         select_statement: Select[tuple[*T]],
         as_mappings: Literal[True],
+        dedupe: bool | None = None,
+        check_all_cols: bool = True,
     ) -> RecordsWithCount[Sequence[RowMapping]]: ...
 
     # NOTE: We've this separate method to fetch specific columns instead of all columns
     #       To avoid adding complexity in `get_multi` method.
     #       Initially, I tried merging both but it ended up in chaos.
-    async def get_multi_for_cols[*T](
+    async def get_multi_for_cols[*T](  # noqa: PLR0913
         self,
         db: AsyncSession,
         *,
         pagination: PaginationPageSize | PaginationOffsetLimit | None = None,
         select_statement: Select[tuple[*T]],
         as_mappings: bool = False,
+        dedupe: bool | None = None,
+        check_all_cols: bool = True,
     ) -> Sequence[RowMapping] | Sequence[tuple[*T]] | RecordsWithCount[Sequence[RowMapping] | Sequence[tuple[*T]]]:
         # Raise value error if select statement has all column of model
         # to indicate that we should use `get_multi` method
-        if set(select_statement.columns.keys()) == set(self.model.__mapper__.columns.keys()):
+        # Perf: Pass `check_all_cols=False` to skip this check in performance critical endpoints
+        # Perf: Statement selecting different number of columns can't select all columns so we skip building the set
+        selected_columns = select_statement.selected_columns
+        if (
+            check_all_cols
+            and len(selected_columns) == len(self._all_column_keys)
+            and set(selected_columns.keys()) == self._all_column_keys
+        ):
             msg = "Use `get_multi` method instead while fetching all columns"
             raise ValueError(msg)
 
-        # --- Initialize statements
-        paginated_statement: Select[tuple[*T]] | None = None
+        if dedupe is None:
+            dedupe = _needs_unique(select_statement)
 
-        # --- Pagination
-        if pagination:
-            if isinstance(pagination, PaginationPageSize):
-                offset, limit = page_size_to_offset_limit(page=pagination.page, size=pagination.size)
-            else:
-                offset, limit = pagination.offset, pagination.limit
+        # --- Fetch records without pagination
+        if not pagination:
+            result = await db.execute(select_statement)
+            if dedupe:
+                result = result.unique()
+            return result.mappings().all() if as_mappings else result.tuples().all()
 
-            paginated_statement = select_statement.limit(limit).offset(offset)
+        # --- Pagination
+        if isinstance(pagination, PaginationPageSize):
+            offset, limit = page_size_to_offset_limit(page=pagination.page, size=pagination.size)
+        else:
+            offset, limit = pagination.offset, pagination.limit
+
+        # NOTE: Window function is evaluated before `DISTINCT` so it would also count duplicate rows.
+        #       Hence, we count deduped rows separately.
+        if _is_distinct(select_statement):
+            result = await db.execute(select_statement.limit(limit).offset(offset))
+            if dedupe:
+                result = result.unique()
+            records = result.mappings().all() if as_mappings else result.tuples().all()
+            return records, await self.count(db, select_statement=select_statement)
+
+        # Perf: Fetch total along with records via `COUNT(*) OVER()` to avoid separate COUNT query
+        n_cols = len(select_statement.selected_columns)
+        paginated_statement = (
+            select_statement.add_columns(func.count().over().label("total")).limit(limit).offset(offset)
+        )
 
         # --- Fetch records
-        result = await db.execute(
-            paginated_statement if paginated_statement is not None else select_statement,
-        )
-        records = result.unique().mappings().all() if as_mappings else result.unique().tuples().all()
+        # Perf: Only dedupe rows when needed to skip hashing each row
+        result = await db.execute(paginated_statement)
+        if dedupe:
+            result = result.unique()
+
+        # NOTE: We freeze the result so we can read the total & also get records without the appended total column
+        frozen_result = result.freeze()
+        records_result = frozen_result().columns(*range(n_cols))
+        records = records_result.mappings().all() if as_mappings else records_result.tuples().all()
 
         # --- Return records
-        if pagination:
-            total = await self.count(db, select_statement=lambda _: select_statement)
-            return records, total
-        return records
+        if frozen_result.data:
+            return records, frozen_result.data[0][-1]
+
+        # NOTE: Window function can't tell total for page that is out of range so we have to count separately
+        total = await self.count(db, select_statement=select_statement) if offset else 0
+        return records, total
 
     async def get_one(
         self,
         db: AsyncSession,
         *,
-        select_statement: Callable[[Select[tuple[ModelType]]], Select[tuple[ModelType]]] = lambda s: s,
+        select_statement: SelectStatement[tuple[ModelType]] = _identity,
         suppress_multiple_result_exc: bool = False,
+        dedupe: bool | None = None,
     ):
         """Get one item or None based on select statement.
 
         Args:
             db: SQLAlchemy AsyncSession
-            select_statement: Select statement to fetch the item
+            select_statement: Select statement or function to modify the default select statement
             suppress_multiple_result_exc: Whether to suppress `MultipleResultsFound` exception
+            dedupe: Whether to dedupe rows. By default, rows are deduped unless statement has no joined eager load
+                at all (`joinedload` option or `lazy="joined"` relationship). Pass `False` to skip it when you know
+                rows can't repeat.
 
         Returns:
             Queried item or None
@@ -362,10 +884,19 @@ class CRUD[
             MultipleResultsFound: If multiple results are found and `suppress_multiple_result_exc` is False
 
         """
-        result = await db.scalars(select_statement(select(self.model)))
+        _select_statement = self._with_lazy_load_guard(_resolve_select_statement(select_statement, self._base_select))
+        if dedupe is None:
+            dedupe = _needs_unique(_select_statement)
+
+        # Perf: Second row is enough to detect multiple results so DB can stop scanning after it.
+        # NOTE: Deduped rows can repeat so limiting them could hide other distinct rows
+        if not dedupe and _select_statement._limit_clause is None:  # noqa: SLF001
+            _select_statement = _select_statement.limit(2)
+
+        result = await db.scalars(_select_statement)
 
         try:
-            return result.unique().one_or_none()
+            return (result.unique() if dedupe else result).one_or_none()
         except MultipleResultsFound:
             if not suppress_multiple_result_exc:
                 raise
@@ -374,12 +905,13 @@ class CRUD[
         self,
         db: AsyncSession,
         *,
-        select_statement: Callable[[Select[tuple[ModelType]]], Select[tuple[ModelType]]] = lambda s: s,
+        select_statement: SelectStatement[tuple[ModelType]] = _identity,
         msg_404: str | None = None,
         msg_multiple_results_exc: str,
+        dedupe: bool | None = None,
     ) -> ModelType:
         try:
-            if result := await self.get_one(db, select_statement=select_statement):
+            if result := await self.get_one(db, select_statement=select_statement, dedupe=dedupe):
                 return result
         except MultipleResultsFound as e:
             raise APIException(
@@ -389,7 +921,7 @@ class CRUD[
 
         raise APIException(
             status=status.HTTP_404_NOT_FOUND,
-            title=msg_404 or self.err_messages[404],
+            title=msg_404 or self._msg_404,
         )
 
     """
@@ -521,7 +1053,7 @@ class CRUD[
 
         raise APIException(
             status=status.HTTP_404_NOT_FOUND,
-            title=msg_404 or self.err_messages[404],
+            title=msg_404 or self._msg_404,
         )
 
     # !SECTION: get_one_for_cols_or_404
@@ -585,7 +1117,7 @@ class CRUD[
         returning: bool = True,
         commit: bool = True,
     ) -> ModelType | None:
-        if not hasattr(self.model, "id"):
+        if not self._has_id:
             msg = f"Model {self.model.__name__} must have 'id' attribute"
             raise AttributeError(msg)
 
@@ -672,7 +1204,11 @@ class CRUD[
         returning: bool = True,
         commit: bool = True,
     ) -> Sequence[ModelType] | None:
-        data_to_update = patched_item.model_dump() if isinstance(patched_item, BaseModel) else patched_item
+        data_to_update = (
+            patched_item.model_dump(mode="python", warnings=False)
+            if isinstance(patched_item, BaseModel)
+            else patched_item
+        )
 
         statement = update(self.model).where(*where).values(data_to_update)
 
@@ -680,70 +1216,107 @@ class CRUD[
             statement = statement.returning(self.model)
 
             result = await db.execute(statement)
-
-            if commit:
-                await db.commit()
+            await self._commit_write(db, commit=commit)
 
             return result.scalars().all()
 
         # If returning is False
         await db.execute(statement)
-        if commit:
-            await db.commit()
+        await self._commit_write(db, commit=commit)
         return None
 
-    async def soft_delete(self, db: AsyncSession, item_id: int, *, commit: bool = True) -> ModelType:
-        item_db = await self.get_or_404(db, item_id)
+    async def soft_delete(
+        self,
+        db: AsyncSession,
+        item_id: int,
+        *,
+        commit: bool = True,
+        refresh: bool = False,
+    ) -> ModelType:
+        """Soft delete an item by ID by setting soft delete column to `True`.
+
+        Args:
+            db: SQLAlchemy AsyncSession
+            item_id: Item ID
+            commit: Whether to commit the transaction. Defaults to True.
+            refresh: Whether to reload the item after commit. Updated row is already loaded via `RETURNING`
+                so pass `True` only if you need values changed outside of this statement. Defaults to False.
 
-        setattr(item_db, self.soft_delete_col_name, True)
+        Returns:
+            Soft deleted item
 
-        db.add(item_db)
+        Raises:
+            AttributeError: If model does not have `id` attribute
+            APIException: If item is not found
 
-        if commit:
-            await db.commit()
+        """
+        if not self._has_id:
+            msg = f"Model {self.model.__name__} must have 'id' attribute"
+            raise AttributeError(msg)
+
+        # Perf: Single `UPDATE ... RETURNING` instead of SELECT, UPDATE on flush & refresh SELECT
+        result = await db.scalars(self._soft_delete_by_id_statement, {"item_id": item_id})
+        item_db = result.one_or_none()
+
+        if item_db is None:
+            raise APIException(
+                status=status.HTTP_404_NOT_FOUND,
+                title=self._msg_404,
+            )
+
+        await self._commit_write(db, commit=commit)
+
+        # NOTE: Session that expires on commit needs refresh regardless,
+        #       otherwise accessing attributes would trigger lazy load.
+        if commit and (refresh or db.sync_session.expire_on_commit):
             await db.refresh(item_db)
 
         return item_db
 
     # TODO: Implement delete where method
-    async def delete(self, db: AsyncSession, item_id: int, *, commit: bool = True) -> int:
+    async def delete(
+        self,
+        db: AsyncSession,
+        item_id: int,
+        *,
+        commit: bool = True,
+        return_rowcount: bool = True,
+    ) -> int | None:
         """Delete an item by ID. Returns the number of rows deleted.
 
         Args:
             db: SQLAlchemy AsyncSession
             item_id: Item ID
             commit: Whether to commit the transaction. Defaults to False.
+            return_rowcount: Whether to return number of deleted rows. Pass `False` for "delete if exists" calls
+                that don't need it. Defaults to True.
 
         Returns:
-            Number of rows deleted
+            Number of rows deleted if `return_rowcount` is True else None
 
         Raises:
             AttributeError: If model does not have `id` attribute
 
         """
-        if not hasattr(self.model, "id"):
+        if not self._has_id:
             msg = f"Model {self.model.__name__} must have 'id' attribute"
             raise AttributeError(msg)
 
-        statement = delete(self.model).where(
-            self.model.id == item_id,  # type: ignore We already checked if model has `id` attribute
-        )
-
-        result = await db.execute(statement)
+        result = await db.execute(self._delete_by_id_statement, {"item_id": item_id})
+        await self._commit_write(db, commit=commit)
 
-        if commit:
-            await db.commit()
-
-        return result.rowcount
+        return result.rowcount if return_rowcount else None
 
     async def count[T, *Ts](
         self,
-        db: AsyncSession,
+        db: AsyncSession | AsyncConnection,
         *,
-        select_statement: Callable[
+        select_statement: Select[tuple[T, *Ts]]
+        | Select[tuple[T]]
+        | Callable[
             [Select[tuple[ModelType]]],
             Select[tuple[T, *Ts]] | Select[tuple[T]],
-        ] = lambda s: s,
+        ] = _identity,
     ) -> int:
         """Count the number of records for given select statement.
 
@@ -751,49 +1324,93 @@ class CRUD[
         Using `count` method is not recommended for checking existence.
 
         Args:
-            db: SQLAlchemy AsyncSession
-            select_statement: Select statement to count the records
+            db: SQLAlchemy AsyncSession or AsyncConnection (skips ORM session overhead)
+            select_statement: Select statement or function to modify the default select statement
 
         Returns:
             Number of records
 
         """
-        count_select_from = select_statement(select(self.model)).subquery()
-        count_statement = select(func.count()).select_from(count_select_from)
+        count_statement = (
+            self._count_statement
+            if select_statement is _identity
+            else _count_statement(_resolve_select_statement(select_statement, self._base_select))
+        )
+
+        if self.count_cache is None:
+            # Perf: COUNT always returns single row so we read it directly instead of wrapping result in `ScalarResult`
+            result = await db.execute(count_statement)
+            return result.scalar_one()
+
+        # Key is compiled SQL along with its parameters so different filter values don't share cached count
+        dialect = db.dialect if isinstance(db, AsyncConnection) else db.get_bind().dialect
+        compiled = count_statement.compile(dialect=dialect)
+        cache_key = f"{compiled}|{compiled.params!r}"
+
+        if (total := self.count_cache.get(cache_key)) is not None:
+            return total
+
+        result = await db.execute(count_statement)
+        total = result.scalar_one()
+        if total >= self.count_cache_min_total:
+            self.count_cache[cache_key] = total
+        return total
+
+    def invalidate_count_cache(self) -> None:
+        """Clear cached `count` results. Called automatically after every write made via this CRUD instance.
+
+        Call it manually if rows of the model are modified outside of this CRUD instance. When writing with
+        `commit=False`, call it again after committing the transaction yourself.
+        """
+        if self.count_cache is not None:
+            self.count_cache.clear()
 
-        result = await db.scalars(count_statement)
-        return result.first() or 0
+    async def _commit_write(self, db: AsyncSession, *, commit: bool) -> None:
+        """Clear cached counts after a write & commit the transaction if asked."""
+        self.invalidate_count_cache()
+
+        if commit:
+            await db.commit()
+
+            # NOTE: Other sessions still count old rows until commit & could've cached them meanwhile
+            self.invalidate_count_cache()
 
     async def exist(
         self,
-        db: AsyncSession,
+        db: AsyncSession | AsyncConnection,
         *,
-        select_statement: Callable[[Select[tuple[ModelType]]], Select[tuple[ModelType]]] = lambda s: s,
+        select_statement: SelectStatement[tuple[ModelType]] = _identity,
     ):
-        base_statement = select_statement(select(1))
+        # Perf: Default modifier doesn't filter anything so we reuse prebuilt `SELECT EXISTS (SELECT 1 FROM ...)`
+        if select_statement is _identity:
+            exist_statement = self._exists_statement
+        else:
+            base_statement = _resolve_select_statement(select_statement, self._exists_base)
 
-        # Perf: Replace columns with `SELECT 1` to optimize the query
-        base_statement = base_statement.with_only_columns(1)
+            # Perf: Replace columns with `SELECT 1` to optimize the query
+            # NOTE: `maintain_column_froms` keeps the model in FROM when statement has no where clause referencing it
+            base_statement = base_statement.with_only_columns(literal(1), maintain_column_froms=True)
 
-        exist_statement = select(exists(base_statement))
+            # Perf: `EXISTS` lets the planner stop at the first matching row
+            exist_statement = select(exists(base_statement))
 
-        result = await db.scalar(exist_statement)
+        result = await db.execute(exist_statement)
 
-        # NOTE: We added `or False` to ensure it don't return `None` value from `.scalar()`
-        return result or False
+        # NOTE: We use `bool` to ensure it don't return `None` value from `.scalar()`
+        return bool(result.scalar())
 
     async def exist_n(
         self,
-        db: AsyncSession,
+        db: AsyncSession | AsyncConnection,
         *,
-        select_statement: Callable[[Select[tuple[ModelType]]], Select[tuple[ModelType]]],
+        select_statement: SelectStatement[tuple[ModelType]],
         n: int,
     ) -> bool:
         """Check if exactly n records exist for given select statement.
 
         Args:
-            db: SQLAlchemy AsyncSession
-            select_statement: Function to modify select statement (e.g. add where clause)
+            db: SQLAlchemy AsyncSession or AsyncConnection (skips ORM session overhead)
+            select_statement: Select statement or function to modify select statement (e.g. add where clause)
             n: Number of records to check for exact match
 
         Returns:
@@ -807,51 +1424,160 @@ class CRUD[
             msg = "n must be greater than or equal to 0"
             raise ValueError(msg)
 
+        # Perf: Exactly 0 records means none exist so `EXISTS` can stop at first matching row
+        if n == 0:
+            return not await self.exist(db, select_statement=select_statement)
+
         # Start with basic SELECT 1 for performance
-        base_statement = select_statement(select(1))
+        base_statement = _resolve_select_statement(select_statement, self._exists_base)
 
         # Replace columns with SELECT 1 to optimize
-        base_statement = base_statement.with_only_columns(1)
+        # NOTE: `maintain_column_froms` keeps the model in FROM when statement has no where clause referencing it
+        base_statement = base_statement.with_only_columns(literal(1), maintain_column_froms=True)
 
-        # Add LIMIT n+1 to optimize by not fetching all records
-        # We fetch n+1 to check if more than n records exist
+        # Add LIMIT n+1 to optimize by not counting all records
+        # We count up to n+1 to check if more than n records exist
         base_statement = base_statement.limit(n + 1)
 
-        # Get all records up to n+1
-        result = await db.scalars(base_statement)
-        records = result.all()
+        # Perf: Count limited rows in DB so only single integer is sent back instead of up to n+1 rows
+        count_statement = select(func.count()).select_from(base_statement.subquery())
+        total = await db.scalar(count_statement) or 0
 
-        # Compare length to check exact match
-        return len(records) == n
+        # Compare count to check exact match
+        return total == n
 
-    async def upsert(
+    async def upsert(  # noqa: PLR0913
         self,
         db: AsyncSession,
         *,
         upserted_items: RootModel[Sequence[SchemaUpsert]],
+        update_cols: Sequence[str] | None = None,
         commit: bool = True,
-    ):
+        returning: bool = False,
+        copy_threshold: int | None = None,
+        fast_bulk: bool = False,
+    ) -> Sequence[ModelType] | None:
         """Perform batch upsert for SQLAlchemy model.
 
         Args:
             db (AsyncSession): SQLAlchemy AsyncSession
             upserted_items (Sequence[SchemaCreate]): List of items to upsert
+            update_cols (Sequence[str] | None, optional): Columns to update on conflict.
+                Defaults to None which updates all non primary key columns.
             commit (bool, optional): Whether to commit the transaction. Defaults to False.
+            returning (bool, optional): Whether to return upserted items via `returning` clause
+                instead of querying them again. Defaults to False.
+                NOTE: When there's nothing to update (`ON CONFLICT DO NOTHING`), conflicting rows aren't returned.
+            copy_threshold (int | None, optional): Minimum number of items to load them via `COPY` into temporary
+                table & upsert from there (only with asyncpg driver). `COPY` is skipped for columns whose values are
+                converted by SQLAlchemy (e.g. JSON, Enum, `TypeDecorator`). Defaults to None which always uses
+                `INSERT`.
+            fast_bulk (bool, optional): Whether to turn off `synchronous_commit` for the transaction (only with
+                PostgreSQL) so commit doesn't wait for WAL flush. Upserted items can be lost if server crashes right
+                after commit but database stays consistent. Defaults to False.
+
+        Returns:
+            Upserted items if `returning` is True else None
 
         """
-        pk_columns = [col.key for col in self.model.__mapper__.primary_key]
+        rows = _dump_root_list(upserted_items)
+
+        # NOTE: Executing with empty parameters list would insert a single row with default values
+        if not rows:
+            return [] if returning else None
 
-        # Get updatable columns (excluding PKs)
-        updatable_columns = [col.key for col in self.model.__mapper__.columns if col.key not in pk_columns]
+        if fast_bulk:
+            await self._disable_synchronous_commit(db)
 
         # Create upsert statement
-        statement = pg_insert(self.model).values(upserted_items.model_dump())
+        # Perf: Huge `VALUES` list has to be parsed & planned on every call. For large batches, binary `COPY`
+        #       into temporary table & upserting from it keeps the statement small & constant.
+        # Perf: Otherwise, rows are passed as parameters (executemany) instead of rendering huge VALUES clause so
+        #       compiled statement is cached regardless of batch size & SQLAlchemy batches rows via "insertmanyvalues".
+        params: Sequence[dict[str, Any]] | None
+        if copy_threshold is not None and len(rows) >= copy_threshold and self._can_copy(db, rows):
+            statement = await self._copy_to_temp_table(db, rows)
+            params = None
+        else:
+            statement = pg_insert(self.model)
+            params = rows
+
+        set_dict = {
+            col: getattr(statement.excluded, col)
+            for col in (self._updatable_keys if update_cols is None else update_cols)
+        }
 
-        set_dict = {col: getattr(statement.excluded, col) for col in updatable_columns}
+        # Perf: Nothing to update on conflict so we skip no-op UPDATE (and its row locks) via `DO NOTHING`
+        if set_dict:
+            statement = statement.on_conflict_do_update(index_elements=self._pk_keys, set_=set_dict)
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=self._pk_keys)
 
-        statement = statement.on_conflict_do_update(index_elements=pk_columns, set_=set_dict)
+        if returning:
+            # NOTE: Updated rows can already be loaded in the session so we overwrite them with returned values
+            returning_statement = statement.returning(self.model).execution_options(populate_existing=True)
+            result = await db.scalars(returning_statement, params)
+            records = result.all()
+            await self._commit_write(db, commit=commit)
 
-        await db.execute(statement)
+            return records
 
-        if commit:
-            await db.commit()
+        # If returning is False
+        await db.execute(statement, params)
+        await self._commit_write(db, commit=commit)
+        return None
+
+    async def _disable_synchronous_commit(self, db: AsyncSession) -> None:
+        """Turn off `synchronous_commit` for current transaction (only with PostgreSQL)."""
+        # NOTE: `SET LOCAL` is reverted at the end of the transaction so pooled connection isn't affected
+        if db.get_bind().dialect.name == "postgresql":
+            await db.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+    def _can_copy(self, db: AsyncSession, rows: Sequence[dict[str, Any]]) -> bool:
+        """Check if rows can be loaded via asyncpg's `COPY`."""
+        dialect = db.get_bind().dialect
+        if dialect.driver != "asyncpg":
+            return False
+
+        # NOTE: `COPY` sends values as they are so values SQLAlchemy would convert before sending (e.g. JSON, Enum,
+        #       `TypeDecorator`) would be rejected by asyncpg or stored differently.
+        columns = self.model.__table__.c
+        return all(columns[key].type.dialect_impl(dialect).bind_processor(dialect) is None for key in rows[0])
+
+    async def _copy_records(self, db: AsyncSession, target_table: TableClause, rows: Sequence[dict[str, Any]]) -> None:
+        """Load rows into given table via asyncpg's `COPY`."""
+        keys = list(rows[0].keys())
+        conn = await db.connection()
+        raw_conn = await conn.get_raw_connection()
+        await raw_conn.driver_connection.copy_records_to_table(
+            target_table.name,
+            records=[tuple(row[key] for key in keys) for row in rows],
+            columns=[self._column_names[key] for key in keys],
+            schema_name=target_table.schema,
+        )
+
+    async def _copy_to_temp_table(self, db: AsyncSession, rows: Sequence[dict[str, Any]]) -> PGInsert:
+        """Load rows into temporary table via asyncpg's `COPY` & return insert statement selecting from it."""
+        model_table = self.model.__table__
+        keys = list(rows[0].keys())
+        column_names = [self._column_names[key] for key in keys]
+
+        conn = await db.connection()
+        preparer = conn.dialect.identifier_preparer
+        tmp_table_name = f"_tmp_upsert_{model_table.name}"
+
+        # NOTE: Temporary table only has payload's columns (without NOT NULL constraints of model's table) & is
+        #       dropped on commit. We drop it upfront in case of multiple upserts in same transaction.
+        #       Name is qualified with `pg_temp` so permanent table with same name can never be dropped.
+        quoted_tmp_table_name = preparer.quote(tmp_table_name)
+        await conn.exec_driver_sql(f"DROP TABLE IF EXISTS pg_temp.{quoted_tmp_table_name}")
+        await conn.exec_driver_sql(
+            f"CREATE TEMP TABLE {quoted_tmp_table_name} ON COMMIT DROP AS "  # noqa: S608 Identifiers come from model & are quoted
+            f"SELECT {', '.join(preparer.quote(name) for name in column_names)} "
+            f"FROM {preparer.format_table(model_table)} WITH NO DATA",
+        )
+
+        tmp_table = table(tmp_table_name, *(column(name) for name in column_names), schema="pg_temp")
+        await self._copy_records(db, tmp_table, rows)
+
+        return pg_insert(self.model).from_select(keys, select(*tmp_table.c))
@@ -1,5 +1,6 @@
 import magic
 from fastapi import UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from fastapi_batteries.fastapi.exceptions.api_exception import APIException
 from fastapi_batteries.utils import mimetypes_utils
@@ -7,6 +8,9 @@ from fastapi_batteries.utils import size as size_utils
 
 
 class FileValidator:
+    # Number of bytes to read at a time when file size isn't known upfront
+    chunk_size_bytes = 64 * 1024
+
     def __init__(self, max_size_bytes: int, allowed_mime_types: list[mimetypes_utils.MimeType]) -> None:
         """Validate file size and extension.
 
@@ -16,18 +20,31 @@ class FileValidator:
         self.max_size_bytes = max_size_bytes  # Convert KB to bytes using provided utility function
         self.allowed_mime_types = allowed_mime_types
 
+        # Perf: Build set once for O(1) lookup while validating each file
+        self._allowed_mime_types_set = frozenset(allowed_mime_types)
+
         self.allowed_files_labels = mimetypes_utils.get_file_labels_from_mime_types(allowed_mime_types)
 
     async def __call__(self, file: UploadFile) -> UploadFile:
-        # Validate file size and content type
-        await self._validate_file_type(file)
+        # Validate file size first as it's cheaper than detecting the content type
         await self._validate_file_size(file)
+        await self._validate_file_type(file)
         return file
 
     async def _validate_file_size(self, file: UploadFile) -> None:
-        # Read the entire file to calculate its size in bytes
-        file_content = await file.read()
-        file_size_bytes = len(file_content)
+        # Perf: Starlette tracks the size while receiving the upload so we don't have to read the file
+        file_size_bytes = file.size
+
+        if file_size_bytes is None:
+            # Read the file in chunks & stop as soon as limit is exceeded instead of loading it entirely in memory
+            file_size_bytes = 0
+            while chunk := await file.read(self.chunk_size_bytes):
+                file_size_bytes += len(chunk)
+                if file_size_bytes > self.max_size_bytes:
+                    break
+
+            # Reset the file cursor to the beginning after reading
+            await file.seek(0)
 
         if file_size_bytes > self.max_size_bytes:
             max_size_mb = size_utils.bytes_to_mb(self.max_size_bytes)  # Convert bytes to MB for the error message
@@ -35,15 +52,15 @@ class FileValidator:
                 status=status.HTTP_400_BAD_REQUEST,
                 title=f"File size exceeds the maximum limit of {max_size_mb:.2f} MB.",
             )
-        # Reset the file cursor to the beginning after reading
-        await file.seek(0)
 
     async def _validate_file_type(self, file: UploadFile) -> None:
         # Read the first 2048 bytes of the file for magic number detection
         file_content = await file.read(2048)
-        file_type = magic.from_buffer(file_content, mime=True)  # Detect MIME type from the first 2048 bytes
 
-        if file_type not in self.allowed_mime_types:
+        # Perf: Detect MIME type in thread pool as libmagic call is blocking & would stall the event loop
+        file_type = await run_in_threadpool(magic.from_buffer, file_content, mime=True)
+
+        if file_type not in self._allowed_mime_types_set:
             file_type_label = mimetypes_utils.get_file_label_from_mime_type(file_type)
 
             raise APIException(
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any
 
 from fastapi import Request
@@ -21,11 +22,18 @@ class QueryCounter:
 
 # Middleware to track DB hits per request
 class QueryCountMiddleware(BaseHTTPMiddleware):
-    """Middleware to count the number of database queries executed during the handling of a request."""
+    """Middleware to count the number of database queries executed during the handling of a request.
 
-    def __init__(self, app: ASGIApp, engine: AsyncEngine) -> None:
+    Args:
+        app: ASGI application
+        engine: Engine to count queries of. Pass sequence of engines (e.g. separate read & write engines) to count
+            queries of all of them.
+
+    """
+
+    def __init__(self, app: ASGIApp, engine: AsyncEngine | Sequence[AsyncEngine]) -> None:
         super().__init__(app)
-        self.engine = engine
+        self.engines = (engine,) if isinstance(engine, AsyncEngine) else tuple(engine)
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
         query_counter = QueryCounter()  # Create a fresh query counter for each request
@@ -35,7 +43,8 @@ class QueryCountMiddleware(BaseHTTPMiddleware):
             query_counter.increment()
 
         # Register the event listener locally for this request
-        event.listen(self.engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        for engine in self.engines:
+            event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
 
         # Proceed with the request and get the response
         response = await call_next(request)
@@ -47,6 +56,7 @@ class QueryCountMiddleware(BaseHTTPMiddleware):
         response.headers["X-DB-Query-Count"] = str(query_count)
 
         # Clean up: remove the event listener to avoid memory leaks
-        event.remove(self.engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        for engine in self.engines:
+            event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
 
         return response
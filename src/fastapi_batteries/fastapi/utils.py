@@ -4,6 +4,9 @@ import warnings
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
+# Perf: Compile once instead of looking up pattern in `re`'s cache for every route
+_NON_WORD_RE = re.compile(r"\W")
+
 
 def use_route_path_as_operation_ids(
     app: FastAPI,
@@ -12,7 +15,7 @@ def use_route_path_as_operation_ids(
 ) -> None:
     for route in app.routes:
         if isinstance(route, APIRoute):
-            normalized_path_format = re.sub(r"\W", "_", route.path_format)
+            normalized_path_format = _NON_WORD_RE.sub("_", route.path_format)
             method_name = next(iter(route.methods)).lower()
 
             # NOTE: We intentionally preserved double underscore in the operation_id to indicate that anything around `__` is path parameter  # noqa: E501
@@ -51,3 +51,31 @@ class PaginationOffsetLimit(BaseModel):
 
     offset: NonNegativeInt = 0
     limit: PositiveInt = 10
+
+
+class PaginationCursor(BaseModel):
+    """We can use this as a query parameter schema for keyset (cursor) pagination.
+
+    Unlike offset pagination, database doesn't have to scan & discard all previous rows so fetching any page
+    costs the same. Pass `next_cursor` of previous page as `cursor` to fetch next page.
+
+    Example:
+        >>> async def get_items(cursor: Annotated[PaginationCursor, Query()]): ...
+        >>> async def get_items(
+        >>>     q: q: str | None = None, # Specific to this endpoint
+        >>>     cursor: Annotated[PaginationCursor, Depends(PaginationCursor)] # Use Depends to use this schema
+        >>> ): ...
+
+    """
+
+    cursor: str | None = None
+    size: PositiveInt = 10
+
+
+class _PaginatedCursorMeta(BaseModel):
+    next_cursor: str | None
+
+
+class PaginatedCursor[T](BaseModel):
+    data: Sequence[T] | RootModel[Sequence[T]]
+    meta: _PaginatedCursorMeta
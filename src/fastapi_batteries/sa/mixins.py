@@ -1,10 +1,18 @@
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import cache
 from typing import Literal
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
 from sqlalchemy.sql import false
 
+# Perf: Prebuilt SQL text is rendered as it is instead of compiling function call tree for every statement
+_UTC_NOW = text("(now() AT TIME ZONE 'UTC')")
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
 
 class MixinId(MappedAsDataclass):
     id: Mapped[int] = mapped_column(primary_key=True, kw_only=True, default=None)
@@ -13,7 +21,12 @@ class MixinId(MappedAsDataclass):
 class MixinCreatedAt(MappedAsDataclass):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        server_default=func.timezone("UTC", func.now()),
+        server_default=_UTC_NOW,
+        # Perf: Value generated in Python is already known after INSERT so it doesn't have to be fetched from DB.
+        # NOTE: `insert_default` sets column's default so ORM & Core `insert(Model)` statements bind it alike.
+        #       Dataclass default `None` lets it apply when value isn't passed to `__init__`.
+        #       `server_default` still applies to rows inserted outside SQLAlchemy (e.g. raw SQL, `COPY`).
+        insert_default=_utc_now,
         default=None,
         kw_only=True,
     )
@@ -22,8 +35,9 @@ class MixinCreatedAt(MappedAsDataclass):
 class MixinUpdatedAt(MappedAsDataclass):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        server_default=func.timezone("UTC", func.now()),
-        onupdate=func.timezone("UTC", func.now()),
+        server_default=_UTC_NOW,
+        onupdate=_utc_now,
+        insert_default=_utc_now,
         default=None,
         kw_only=True,
     )
@@ -36,6 +50,27 @@ class MixinIsDeleted(MappedAsDataclass):
 type Mixin = Literal["created_at", "updated_at", "is_deleted"]
 
 
+# Perf: Same mixin & column name always return same class instead of building new class (and mapping) on every call
+@cache
+def _get_renamed(source_mixin: type, renamed_col: str) -> type[MappedAsDataclass]:
+    original_col, type_annotation = next(iter(source_mixin.__annotations__.items()))
+
+    # NOTE: Each renamed mixin gets its own copy of column definition (same as SQLAlchemy does for mixin columns)
+    #       so mixins don't share state of the source mixin's column.
+    #       `_copy` is private API, `test_renamed_mixin_keeps_source_column_definition` guards it on SQLAlchemy upgrade.
+    column_def = source_mixin.__dict__[original_col]._copy()  # noqa: SLF001
+
+    # Create new mixin class with proper type annotation
+    return type(
+        f"_RenamedMixin_{source_mixin.__name__}_{renamed_col}",
+        (MappedAsDataclass,),
+        {
+            renamed_col: column_def,
+            "__annotations__": {renamed_col: type_annotation},
+        },
+    )
+
+
 class MixinFactory:
     """Factory mixin to create instances of the model.
 
@@ -65,16 +100,4 @@ class MixinFactory:
             ValueError: If mixin_name is not valid
 
         """
-        original_col = next(iter(source_mixin.__annotations__))
-        column_def = getattr(source_mixin, original_col)
-        type_annotation = source_mixin.__annotations__[original_col]
-
-        # Create new mixin class with proper type annotation
-        return type(
-            "_RenamedMixin",
-            (MappedAsDataclass,),
-            {
-                renamed_col: column_def,
-                "__annotations__": {renamed_col: type_annotation},
-            },
-        )
+        return _get_renamed(source_mixin, renamed_col)
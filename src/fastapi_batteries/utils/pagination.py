@@ -1,3 +1,16 @@
+import base64
+import json
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from pydantic_core import to_json
+
+# NOTE: SQLAlchemy is only imported for type hints so utils can be used without it
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+    from sqlalchemy.orm import InstrumentedAttribute
+
+
 # TODO: Move generic utils that are not related to fastapi batteries to a separate package "pytils-jd"
 def page_size_to_offset_limit(*, page: int, size: int):
     """Convert page and size to offset and limit.
@@ -29,3 +42,97 @@ def page_size_to_offset_limit(*, page: int, size: int):
         raise ValueError(msg)
 
     return (page - 1) * size, size
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode values of last row's ordering columns into opaque cursor for keyset pagination.
+
+    Args:
+        values: Values of ordering columns (including primary key) of last row of the page.
+
+    Returns:
+        URL safe base64 encoded JSON of values.
+
+    Examples:
+        >>> encode_cursor([1])
+        'WzFd'
+        >>> decode_cursor(encode_cursor(["John", 1]))
+        ['John', 1]
+
+    """
+    return base64.urlsafe_b64encode(to_json(list(values))).decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode cursor created via `encode_cursor` back to values of ordering columns.
+
+    Args:
+        cursor: Cursor created via `encode_cursor`.
+
+    Returns:
+        Values of ordering columns. Non JSON types (e.g. datetime) are returned in their JSON form.
+
+    Raises:
+        ValueError: If cursor is invalid.
+
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from e
+
+    if not isinstance(values, list):
+        msg = "Invalid cursor"
+        raise ValueError(msg)  # noqa: TRY004
+
+    return values
+
+
+def keyset_paginate[T: tuple[Any, ...]](
+    statement: "Select[T]",
+    *,
+    order_col: "InstrumentedAttribute[Any]",
+    last_seen_value: Any = None,  # noqa: ANN401
+    size: int,
+) -> tuple["Select[T]", Callable[[Sequence[Any]], Any]]:
+    """Paginate select statement via keyset (seek) pagination instead of `OFFSET`.
+
+    `OFFSET N` makes DB scan & discard N rows so it gets slower with each page. Seeking past last seen value of
+    ordering column lets DB jump to the next page via index regardless of how deep the page is. In exchange,
+    pages can only be walked one after another (no jumping to random page).
+
+    Args:
+        statement: Select statement to paginate.
+        order_col: Column to order & seek by. Values must be unique & not null otherwise rows can be skipped.
+        last_seen_value: Value of `order_col` of last row of previous page. Pass None to get first page.
+        size: Page size.
+
+    Returns:
+        Paginated statement & function that takes rows of the page and returns `last_seen_value` for next page
+        (None if page isn't full so there's no next page).
+
+    Examples:
+        >>> statement, get_next_value = keyset_paginate(select(User), order_col=User.id, size=10)
+        >>> users = (await db.scalars(statement)).all()
+        >>> statement, get_next_value = keyset_paginate(select(User), order_col=User.id,
+        ...                                             last_seen_value=get_next_value(users), size=10)
+
+    Raises:
+        ValueError: If size is less than 1.
+
+    """
+    if size < 1:
+        msg = "Size must be greater than 0"
+        raise ValueError(msg)
+
+    # NOTE: Existing ordering is replaced as rows must be ordered by the column we seek by
+    statement = statement.order_by(None).order_by(order_col).limit(size)
+    if last_seen_value is not None:
+        statement = statement.where(order_col > last_seen_value)
+
+    def get_next_value(rows: Sequence[Any]) -> Any:  # noqa: ANN401
+        # NOTE: Both ORM instances & rows of selected columns expose value via column's key
+        return getattr(rows[-1], order_col.key) if len(rows) == size else None
+
+    return statement, get_next_value
@@ -6,7 +6,7 @@ def bytes_to_kb(bytes: int) -> float:  # noqa: A002
 
 def bytes_to_mb(bytes: int) -> float:  # noqa: A002
     """Convert bytes to megabytes."""
-    return bytes / 1000 / 1000
+    return bytes / 1_000_000
 
 
 def kb_to_bytes(kb: float) -> int:
@@ -21,7 +21,7 @@ def kb_to_mb(kb: float) -> int:
 
 def mb_to_bytes(mb: float) -> int:
     """Convert megabytes to bytes."""
-    return int(mb * 1000 * 1000)
+    return int(mb * 1_000_000)
 
 
 def mb_to_kb(mb: float) -> int:
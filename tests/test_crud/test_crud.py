@@ -1,16 +1,21 @@
-from collections.abc import AsyncGenerator
+import warnings
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import suppress
+from types import SimpleNamespace
+from typing import Any, cast
 
 import pytest
 import pytest_asyncio
-from pydantic import BaseModel, EmailStr
-from sqlalchemy import String
-from sqlalchemy.exc import PendingRollbackError
+from pydantic import BaseModel, EmailStr, RootModel
+from sqlalchemy import JSON, ForeignKey, Select, String, delete, func, select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.exc import InvalidRequestError, MultipleResultsFound, PendingRollbackError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Mapped, aliased, joinedload, mapped_column, relationship, sessionmaker
 
 from fastapi_batteries.crud import CRUD
-from fastapi_batteries.pydantic.schemas import PaginationOffsetLimit
+from fastapi_batteries.fastapi.exceptions import APIException
+from fastapi_batteries.pydantic.schemas import PaginationCursor, PaginationOffsetLimit, PaginationPageSize
 from fastapi_batteries.sa.mixins import MixinId
 
 
@@ -26,6 +31,64 @@ class User(Base, MixinId):
     is_deleted: Mapped[bool] = mapped_column(default=False)
 
 
+class Setting(Base, MixinId):
+    __tablename__ = "settings"
+
+    key: Mapped[str] = mapped_column(String(255))
+    value: Mapped[dict[str, Any] | None] = mapped_column(JSON, default=None)
+
+
+# Single table inheritance
+class Employee(Base, MixinId):
+    __tablename__ = "employees"
+
+    name: Mapped[str] = mapped_column(String(255))
+    type: Mapped[str] = mapped_column(String(50), init=False)
+
+    __mapper_args__ = {"polymorphic_on": "type", "polymorphic_identity": "employee"}  # noqa: RUF012
+
+
+class Manager(Employee):
+    __mapper_args__ = {"polymorphic_identity": "manager"}  # noqa: RUF012
+
+
+# Relationships
+class Author(Base, MixinId):
+    __tablename__ = "authors"
+
+    name: Mapped[str] = mapped_column(String(255))
+    books: Mapped[list["Book"]] = relationship(default_factory=list)
+
+
+class Book(Base, MixinId):
+    __tablename__ = "books"
+
+    title: Mapped[str] = mapped_column(String(255))
+    author_id: Mapped[int | None] = mapped_column(ForeignKey("authors.id"), default=None)
+
+
+class Post(Base, MixinId):
+    __tablename__ = "posts"
+
+    title: Mapped[str] = mapped_column(String(255))
+    tags: Mapped[list["Tag"]] = relationship(lazy="joined", default_factory=list)
+
+
+class Tag(Base, MixinId):
+    __tablename__ = "tags"
+
+    name: Mapped[str] = mapped_column(String(255))
+    post_id: Mapped[int | None] = mapped_column(ForeignKey("posts.id"), default=None)
+
+
+class Comment(Base, MixinId):
+    __tablename__ = "comments"
+
+    body: Mapped[str] = mapped_column(String(255))
+    post_id: Mapped[int | None] = mapped_column(ForeignKey("posts.id"), default=None)
+    post: Mapped[Post | None] = relationship(lazy="joined", default=None)
+
+
 # Pydantic Schemas
 class UserCreate(BaseModel):
     email: EmailStr
@@ -41,6 +104,54 @@ class UserUpsert(UserCreate):
     id: int
 
 
+class RecordingPGSession:
+    """Stand-in for session on PostgreSQL via asyncpg that records statements instead of executing them."""
+
+    def __init__(self) -> None:
+        self.dialect = PGDialect_asyncpg()
+        self.statements: list[Any] = []
+        self.driver_sql: list[str] = []
+        self.copied: list[tuple[str, str | None, list[tuple[Any, ...]], list[str]]] = []
+
+    def compiled(self, index: int = -1) -> str:
+        return " ".join(str(self.statements[index].compile(dialect=self.dialect)).split())
+
+    def get_bind(self) -> SimpleNamespace:
+        return SimpleNamespace(dialect=self.dialect)
+
+    async def execute(self, statement: Any, params: Any = None) -> SimpleNamespace:  # noqa: ANN401, ARG002
+        self.statements.append(statement)
+        return SimpleNamespace(rowcount=0)
+
+    async def scalars(self, statement: Any, params: Any = None) -> SimpleNamespace:  # noqa: ANN401, ARG002
+        self.statements.append(statement)
+        return SimpleNamespace(all=list)
+
+    async def commit(self) -> None: ...
+
+    async def connection(self) -> SimpleNamespace:
+        async def exec_driver_sql(sql: str) -> None:
+            self.driver_sql.append(sql)
+
+        async def get_raw_connection() -> SimpleNamespace:
+            async def copy_records_to_table(
+                table_name: str,
+                *,
+                records: list[tuple[Any, ...]],
+                columns: list[str],
+                schema_name: str | None,
+            ) -> None:
+                self.copied.append((table_name, schema_name, records, columns))
+
+            return SimpleNamespace(driver_connection=SimpleNamespace(copy_records_to_table=copy_records_to_table))
+
+        return SimpleNamespace(
+            dialect=self.dialect,
+            exec_driver_sql=exec_driver_sql,
+            get_raw_connection=get_raw_connection,
+        )
+
+
 # Fixtures
 @pytest_asyncio.fixture(scope="session")
 async def async_engine() -> AsyncGenerator[AsyncEngine]:
@@ -100,6 +211,49 @@ async def test_create_user(
     await user_crud.delete(db, user.id)
 
 
+@pytest.mark.asyncio
+async def test_create_users_in_batches(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Allow only two rows (two columns each) per insert statement
+    monkeypatch.setattr(db.get_bind().dialect, "insertmanyvalues_max_parameters", 4)
+
+    users_data = [UserCreate(email=f"batch{i}@example.com", name=f"Batch {i}") for i in range(5)]
+    users = await user_crud.create(db, RootModel[Sequence[UserCreate]](users_data))
+
+    assert [user.email for user in users] == [user.email for user in users_data]
+
+    for user in users:
+        await user_crud.delete(db, user.id)
+
+
+@pytest.mark.asyncio
+async def test_create_users_with_fast_bulk_outside_postgres(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+) -> None:
+    users_data = [UserCreate(email=f"fast{i}@example.com", name=f"Fast {i}") for i in range(2)]
+    users = await user_crud.create(db, RootModel[Sequence[UserCreate]](users_data), fast_bulk=True)
+
+    assert len(users) == len(users_data)
+
+    for user in users:
+        await user_crud.delete(db, user.id)
+
+
+def test_copy_is_skipped_for_values_converted_by_sqlalchemy(db: AsyncSession) -> None:
+    asyncpg_db = cast("AsyncSession", RecordingPGSession())
+    setting_crud = CRUD[Setting, BaseModel, BaseModel, BaseModel](model=Setting)
+
+    assert setting_crud._can_copy(asyncpg_db, [{"key": "theme"}]) is True  # noqa: SLF001
+    assert setting_crud._can_copy(asyncpg_db, [{"key": "theme", "value": {"dark": True}}]) is False  # noqa: SLF001
+
+    # `COPY` is only available with asyncpg
+    assert setting_crud._can_copy(db, [{"key": "theme"}]) is False  # noqa: SLF001
+
+
 @pytest.mark.asyncio
 async def test_get_user(
     db: AsyncSession,
@@ -120,6 +274,21 @@ async def test_get_user_404(
     assert user is None
 
 
+@pytest.mark.asyncio
+async def test_get_many_users(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,
+) -> None:
+    users = await user_crud.get_many(db, [sample_user.id, 999])
+    assert list(users) == [sample_user.id]
+    assert await user_crud.get_many(db, []) == {}
+
+    with pytest.raises(APIException) as exc_info:
+        await user_crud.get_many_or_404(db, [sample_user.id, 999])
+    assert exc_info.value.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_patch_user(
     db: AsyncSession,
@@ -151,6 +320,211 @@ async def test_get_multi(
     assert total == 5
 
 
+@pytest.mark.asyncio
+async def test_get_multi_with_cursor_pagination(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+) -> None:
+    users_data = [UserCreate(email=f"cursor{i}@example.com", name=f"Cursor {i % 2}") for i in range(5)]
+    created_users = await user_crud.create(db, RootModel[Sequence[UserCreate]](users_data))
+    created_ids = {user.id for user in created_users}
+
+    def only_created(s: Select[tuple[User]]) -> Select[tuple[User]]:
+        return s.where(User.email.like("cursor%"))
+
+    fetched_users: list[User] = []
+    cursor = None
+    while True:
+        users, cursor = await user_crud.get_multi(
+            db,
+            pagination=PaginationCursor(cursor=cursor, size=2),
+            select_statement=only_created,
+            order_by=[User.name],
+        )
+        fetched_users.extend(users)
+        if cursor is None:
+            break
+
+    assert len(fetched_users) == len(created_ids)
+    assert {user.id for user in fetched_users} == created_ids
+    assert [(user.name, user.id) for user in fetched_users] == sorted((user.name, user.id) for user in created_users)
+
+    with pytest.raises(APIException) as exc_info:
+        await user_crud.get_multi(db, pagination=PaginationCursor(cursor="invalid", size=2), order_by=[User.name])
+    assert exc_info.value.status_code == 400
+
+    for user_id in created_ids:
+        await user_crud.delete(db, user_id)
+
+
+@pytest.mark.asyncio
+async def test_get_multi_order_by(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+) -> None:
+    users_data = [UserCreate(email=f"order{i}@example.com", name=f"Order {2 - i}") for i in range(3)]
+    created_users = await user_crud.create(db, RootModel[Sequence[UserCreate]](users_data))
+    expected_names = ["Order 0", "Order 1", "Order 2"]
+
+    def only_created(s: Select[tuple[User]]) -> Select[tuple[User]]:
+        return s.where(User.email.like("order%"))
+
+    # `order_by` is honoured without pagination & with offset pagination
+    users = await user_crud.get_multi(db, select_statement=only_created, order_by=[User.name])
+    assert [user.name for user in users] == expected_names
+
+    users, total = await user_crud.get_multi(
+        db,
+        pagination=PaginationPageSize(page=1, size=2),
+        select_statement=only_created,
+        order_by=[User.name],
+    )
+    assert [user.name for user in users] == expected_names[:2]
+    assert total == 3
+
+    # Ordinary page numbers don't warn
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        await user_crud.get_multi(db, pagination=PaginationPageSize(page=12, size=10), select_statement=only_created)
+
+    # Cursor pagination takes ordering only via `order_by` columns of the model
+    with pytest.raises(ValueError, match="Pass ordering via `order_by`"):
+        await user_crud.get_multi(
+            db,
+            pagination=PaginationCursor(size=2),
+            select_statement=lambda s: only_created(s).order_by(User.name),
+        )
+    with pytest.raises(ValueError, match="must belong to User"):
+        await user_crud.get_multi(
+            db,
+            pagination=PaginationCursor(size=2),
+            select_statement=lambda s: only_created(s).join(Author, Author.name == User.name),
+            order_by=[Author.name],
+        )
+
+    for user in created_users:
+        await user_crud.delete(db, user.id)
+
+
+@pytest.mark.asyncio
+async def test_get_multi_stream(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,
+) -> None:
+    users = [user async for user in user_crud.get_multi_stream(db, yield_per=1)]
+    assert sample_user.id in {user.id for user in users}
+    assert len(users) == await user_crud.count(db)
+
+    users = [
+        user
+        async for user in user_crud.get_multi_stream(db, select_statement=lambda s: s.where(User.id == sample_user.id))
+    ]
+    assert [user.id for user in users] == [sample_user.id]
+
+
+@pytest.mark.asyncio
+async def test_get_multi_page_out_of_range(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,  # noqa: ARG001
+) -> None:
+    total_users = await user_crud.count(db)
+
+    users, total = await user_crud.get_multi(db, pagination=PaginationOffsetLimit(offset=total_users, limit=3))
+
+    assert len(users) == 0
+    assert total == total_users
+
+
+@pytest.mark.asyncio
+async def test_get_multi_with_pagination_and_distinct(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+) -> None:
+    for i in range(2):
+        await user_crud.create(db, UserCreate(email=f"distinct{i}@example.com", name="Distinct User"))
+
+    # Self join on name yields each user twice
+    same_name_user = aliased(User)
+    statement = (
+        select(User)
+        .join(same_name_user, same_name_user.name == User.name)
+        .where(User.name == "Distinct User")
+        .distinct()
+    )
+
+    users, total = await user_crud.get_multi(db, pagination=PaginationOffsetLimit(limit=10), select_statement=statement)
+    assert len(users) == 2
+    assert total == 2
+
+
+@pytest.mark.asyncio
+async def test_get_multi_for_cols_with_pagination_and_distinct(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+) -> None:
+    for i in range(2):
+        await user_crud.create(db, UserCreate(email=f"distinct-cols{i}@example.com", name="Distinct Cols User"))
+    statement = select(User.name).where(User.name == "Distinct Cols User").distinct()
+
+    rows, total = await user_crud.get_multi_for_cols(
+        db,
+        pagination=PaginationOffsetLimit(limit=10),
+        select_statement=statement,
+    )
+    assert rows == [("Distinct Cols User",)]
+    assert total == 1
+
+
+@pytest.mark.asyncio
+async def test_get_multi_for_cols_with_all_columns(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+) -> None:
+    with pytest.raises(ValueError, match="Use `get_multi` method instead"):
+        await user_crud.get_multi_for_cols(db, select_statement=select(User))
+
+    rows = await user_crud.get_multi_for_cols(db, select_statement=select(User), check_all_cols=False)
+    assert isinstance(rows, Sequence)
+
+
+@pytest.mark.asyncio
+async def test_get_multi_for_cols_with_pagination(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,  # noqa: ARG001
+) -> None:
+    total_users = await user_crud.count(db)
+    statement = select(User.id, User.email)
+
+    rows, total = await user_crud.get_multi_for_cols(
+        db,
+        pagination=PaginationOffsetLimit(limit=1),
+        select_statement=statement,
+    )
+    assert total == total_users
+    assert len(rows) == 1
+    assert len(rows[0]) == 2
+
+    mappings, total = await user_crud.get_multi_for_cols(
+        db,
+        pagination=PaginationOffsetLimit(limit=1),
+        select_statement=statement,
+        as_mappings=True,
+    )
+    assert total == total_users
+    assert set(mappings[0].keys()) == {"id", "email"}
+
+    rows, total = await user_crud.get_multi_for_cols(
+        db,
+        pagination=PaginationOffsetLimit(offset=total_users, limit=1),
+        select_statement=statement,
+    )
+    assert len(rows) == 0
+    assert total == total_users
+
+
 @pytest.mark.asyncio
 async def test_soft_delete(
     db: AsyncSession,
@@ -166,19 +540,411 @@ async def test_soft_delete(
     assert user.is_deleted is True
 
 
+@pytest.mark.asyncio
+async def test_soft_delete_missing_item(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+) -> None:
+    with pytest.raises(APIException) as exc_info:
+        await user_crud.soft_delete(db, 999_999)
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_soft_delete_with_expire_on_commit_session(
+    async_engine: AsyncEngine,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,
+) -> None:
+    async with AsyncSession(async_engine, expire_on_commit=True) as session:
+        deleted_user = await user_crud.soft_delete(session, sample_user.id)
+
+        # Expired attributes must be reloaded by `soft_delete` instead of lazy loading on access
+        assert deleted_user.is_deleted is True
+
+
 @pytest.mark.asyncio
 async def test_hard_delete(
     db: AsyncSession,
     user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
     sample_user: User,
 ) -> None:
-    await user_crud.delete(db, sample_user.id)
+    assert await user_crud.delete(db, sample_user.id) == 1
 
     # User should not be retrievable
     user = await user_crud.get(db, sample_user.id)
     assert user is None
 
 
+@pytest.mark.asyncio
+async def test_hard_delete_without_rowcount(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,
+) -> None:
+    assert await user_crud.delete(db, sample_user.id, return_rowcount=False) is None
+    assert await user_crud.get(db, sample_user.id) is None
+
+    # Deleting missing item is no-op
+    assert await user_crud.delete(db, sample_user.id, return_rowcount=False) is None
+
+
+@pytest.mark.asyncio
+async def test_select_statement_as_select_or_callable(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,
+) -> None:
+    statement = select(User).where(User.email == sample_user.email)
+
+    assert await user_crud.count(db, select_statement=statement) == 1
+    assert await user_crud.count(db, select_statement=lambda s: s.where(User.email == sample_user.email)) == 1
+
+    user = await user_crud.get_one(db, select_statement=statement)
+    assert user is not None
+    assert user.id == sample_user.id
+
+
+@pytest.mark.asyncio
+async def test_count_with_limit_distinct_and_group_by(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+) -> None:
+    await user_crud.create(db, UserCreate(email="count1@example.com", name="Count User"))
+    await user_crud.create(db, UserCreate(email="count2@example.com", name="Count User"))
+    same_name_statement = select(User.name).where(User.name == "Count User")
+
+    assert await user_crud.count(db, select_statement=same_name_statement) == 2
+    assert await user_crud.count(db, select_statement=same_name_statement.limit(1)) == 1
+    assert await user_crud.count(db, select_statement=same_name_statement.distinct()) == 1
+    assert (
+        await user_crud.count(db, select_statement=same_name_statement.add_columns(func.count()).group_by(User.name))
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_one_with_multiple_results(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+) -> None:
+    for i in range(3):
+        await user_crud.create(db, UserCreate(email=f"multiple{i}@example.com", name="Multiple User"))
+    statement = select(User).where(User.name == "Multiple User")
+
+    with pytest.raises(MultipleResultsFound):
+        await user_crud.get_one(db, select_statement=statement)
+
+    assert await user_crud.get_one(db, select_statement=statement, suppress_multiple_result_exc=True) is None
+    assert await user_crud.get_one(db, select_statement=statement.limit(1)) is not None
+
+
+@pytest.mark.asyncio
+async def test_get_with_joined_collection_is_deduped(db: AsyncSession) -> None:
+    post = Post(title="Joined Post", tags=[Tag(name="a"), Tag(name="b")])
+    author = Author(name="Joined Author", books=[Book(title="a"), Book(title="b")])
+    comment = Comment(body="Joined Comment", post=post)
+    db.add_all([post, author, comment])
+    await db.commit()
+
+    # Collection with `lazy="joined"` on selected entity
+    post_crud = CRUD[Post, BaseModel, BaseModel, BaseModel](model=Post)
+    assert [p.id for p in await post_crud.get_multi(db)] == [post.id]
+    assert list(await post_crud.get_many(db, [post.id])) == [post.id]
+    assert await post_crud.get_one(db) is not None
+
+    # Collection with `lazy="joined"` reached via another joined relationship
+    comment_crud = CRUD[Comment, BaseModel, BaseModel, BaseModel](model=Comment)
+    assert [c.id for c in await comment_crud.get_multi(db)] == [comment.id]
+    assert list(await comment_crud.get_many(db, [comment.id])) == [comment.id]
+    assert await comment_crud.get_one(db) is not None
+
+    # Collection eager loaded via `joinedload` option
+    author_crud = CRUD[Author, BaseModel, BaseModel, BaseModel](model=Author)
+    with_books = select(Author).options(joinedload(Author.books))
+    assert [a.id for a in await author_crud.get_multi(db, select_statement=with_books)] == [author.id]
+    assert await author_crud.get_one(db, select_statement=with_books) is not None
+
+    for model in (Comment, Tag, Post, Book, Author):
+        await db.execute(delete(model))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_raise_on_lazy_load(db: AsyncSession) -> None:
+    author = Author(name="Lazy Author", books=[Book(title="a")])
+    db.add(author)
+    await db.commit()
+    db.expunge_all()
+
+    guarded_crud = CRUD[Author, BaseModel, BaseModel, BaseModel](model=Author, raise_on_lazy_load=True)
+    guarded_author = await guarded_crud.get_or_404(db, author.id)
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        await db.run_sync(lambda _: guarded_author.books)
+    db.expunge_all()
+
+    (guarded_author,) = await guarded_crud.get_multi(db, select_statement=lambda s: s.where(Author.id == author.id))
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        await db.run_sync(lambda _: guarded_author.books)
+    db.expunge_all()
+
+    # Without the flag, relationship is lazy loaded as usual
+    author_crud = CRUD[Author, BaseModel, BaseModel, BaseModel](model=Author)
+    lazy_author = await author_crud.get_or_404(db, author.id)
+    books = await db.run_sync(lambda _: lazy_author.books)
+    assert [book.title for book in books] == ["a"]
+
+    await db.execute(delete(Book))
+    await db.execute(delete(Author))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_read_methods_dedupe_joinedload_collection_by_default(db: AsyncSession) -> None:
+    authors = [Author(name=f"Dedupe Author {i}", books=[Book(title="a"), Book(title="b")]) for i in range(2)]
+    db.add_all(authors)
+    await db.commit()
+    author_ids = [author.id for author in authors]
+    author_crud = CRUD[Author, BaseModel, BaseModel, BaseModel](model=Author)
+    statement = select(Author).options(joinedload(Author.books))
+
+    assert await author_crud.get_one(db, select_statement=statement.where(Author.id == author_ids[0])) is not None
+
+    records = await author_crud.get_multi(db, select_statement=statement, order_by=[Author.id])
+    assert [a.id for a in records] == author_ids
+
+    records, total = await author_crud.get_multi(
+        db,
+        pagination=PaginationOffsetLimit(limit=10),
+        select_statement=statement,
+        order_by=[Author.id],
+    )
+    assert [a.id for a in records] == author_ids
+    assert total == len(author_ids)
+
+    records, cursor = await author_crud.get_multi(
+        db,
+        pagination=PaginationCursor(size=10),
+        select_statement=statement,
+    )
+    assert [a.id for a in records] == author_ids
+    assert cursor is None
+
+    ordered_statement = statement.order_by(Author.id)
+    rows = await author_crud.get_multi_for_cols(db, select_statement=ordered_statement, check_all_cols=False)
+    assert [row[0].id for row in rows] == author_ids
+
+    rows, total = await author_crud.get_multi_for_cols(
+        db,
+        pagination=PaginationOffsetLimit(limit=10),
+        select_statement=ordered_statement,
+        check_all_cols=False,
+    )
+    assert [row[0].id for row in rows] == author_ids
+    assert total == len(author_ids)
+
+    await db.execute(delete(Book))
+    await db.execute(delete(Author))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_count_with_single_table_inheritance(db: AsyncSession) -> None:
+    db.add_all([Employee(name="Employee 1"), Employee(name="Employee 2"), Manager(name="Manager 1")])
+    await db.commit()
+    manager_crud = CRUD[Manager, BaseModel, BaseModel, BaseModel](model=Manager)
+
+    # Unfiltered count uses statement prebuilt at initialization
+    assert await manager_crud.count(db) == 1
+    assert await manager_crud.count(db, select_statement=lambda s: s.where(Manager.name.startswith("Manager"))) == 1
+
+    # Out of range page counts separately
+    managers, total = await manager_crud.get_multi(db, pagination=PaginationOffsetLimit(offset=10, limit=10))
+    assert managers == []
+    assert total == 1
+
+    await db.execute(delete(Employee))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_count_and_exist_with_connection(
+    async_engine: AsyncEngine,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,
+) -> None:
+    statement = select(User).where(User.email == sample_user.email)
+
+    async with async_engine.connect() as conn:
+        assert await user_crud.count(conn, select_statement=statement) == 1
+        assert await user_crud.exist(conn, select_statement=statement) is True
+        assert await user_crud.exist_n(conn, select_statement=statement, n=1) is True
+
+
+@pytest.mark.asyncio
+async def test_count_cache_is_invalidated_on_write(db: AsyncSession) -> None:
+    count_cache: dict[str, int] = {}
+    user_crud = CRUD[User, UserCreate, UserPatch, UserUpsert](model=User, count_cache=count_cache)
+
+    total = await user_crud.count(db)
+    assert len(count_cache) == 1
+    assert await user_crud.count(db) == total
+
+    # Different filter values must not share cached count
+    assert await user_crud.count(db, select_statement=lambda s: s.where(User.email == "missing@example.com")) == 0
+    assert len(count_cache) == 2
+
+    user = await user_crud.create(db, UserCreate(email="cache@example.com", name="Cache User"))
+    assert count_cache == {}
+    assert await user_crud.count(db) == total + 1
+
+    await user_crud.delete(db, user.id)
+    assert count_cache == {}
+    assert await user_crud.count(db) == total
+
+
+@pytest.mark.asyncio
+async def test_count_cache_is_invalidated_after_commit(db: AsyncSession, monkeypatch: pytest.MonkeyPatch) -> None:
+    count_cache: dict[str, int] = {}
+    user_crud = CRUD[User, UserCreate, UserPatch, UserUpsert](model=User, count_cache=count_cache)
+    commit = db.commit
+
+    async def commit_with_concurrent_count() -> None:
+        # Count made by other session before commit still sees old rows
+        count_cache["stale"] = 0
+        await commit()
+
+    monkeypatch.setattr(db, "commit", commit_with_concurrent_count)
+    user = await user_crud.create(db, UserCreate(email="commit@example.com", name="Commit User"))
+    assert count_cache == {}
+
+    await user_crud.delete(db, user.id)
+    assert count_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_count_cache_skips_small_totals(db: AsyncSession) -> None:
+    count_cache: dict[str, int] = {}
+    user_crud = CRUD[User, UserCreate, UserPatch, UserUpsert](
+        model=User,
+        count_cache=count_cache,
+        count_cache_min_total=1,
+    )
+
+    assert await user_crud.count(db, select_statement=lambda s: s.where(User.email == "missing@example.com")) == 0
+    assert count_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_exist_without_where_clause(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,
+) -> None:
+    total = await user_crud.count(db)
+    assert total >= 1
+
+    assert await user_crud.exist(db) is True
+    assert await user_crud.exist(db, select_statement=select(User).where(User.id == sample_user.id)) is True
+    assert await user_crud.exist_n(db, select_statement=select(User), n=total) is True
+    assert await user_crud.exist_n(db, select_statement=lambda s: s, n=total + 1) is False
+    assert await user_crud.exist_n(db, select_statement=lambda s: s, n=0) is False
+    assert await user_crud.exist_n(db, select_statement=lambda s: s.where(User.email == "missing@example.com"), n=0)
+    assert await user_crud.exist(db, select_statement=lambda s: s.where(User.email == "missing@example.com")) is False
+
+
+@pytest.mark.asyncio
+async def test_upsert_statement_on_postgres(user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert]) -> None:
+    items = RootModel[Sequence[UserUpsert]]([UserUpsert(id=1, email="upsert@example.com", name="Upsert User")])
+    db = RecordingPGSession()
+    pg_db = cast("AsyncSession", db)
+
+    # All non primary key columns are updated by default
+    await user_crud.upsert(pg_db, upserted_items=items)
+    assert db.compiled().endswith(
+        "ON CONFLICT (id) DO UPDATE SET email = excluded.email, name = excluded.name, is_deleted = excluded.is_deleted",
+    )
+
+    await user_crud.upsert(pg_db, upserted_items=items, update_cols=["name"])
+    assert db.compiled().endswith("ON CONFLICT (id) DO UPDATE SET name = excluded.name")
+
+    # Nothing to update skips no-op UPDATE
+    await user_crud.upsert(pg_db, upserted_items=items, update_cols=[])
+    assert db.compiled().endswith("ON CONFLICT (id) DO NOTHING")
+
+    await user_crud.upsert(pg_db, upserted_items=items, update_cols=["name"], returning=True)
+    assert db.compiled().endswith(
+        "ON CONFLICT (id) DO UPDATE SET name = excluded.name "
+        "RETURNING users.email, users.name, users.is_deleted, users.id",
+    )
+
+
+@pytest.mark.asyncio
+async def test_upsert_in_batches_with_returning(
+    db: AsyncSession,
+    user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert],
+    sample_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Allow only one row (four columns) per insert statement
+    monkeypatch.setattr(db.get_bind().dialect, "insertmanyvalues_max_parameters", 4)
+    new_ids = [1_000_001, 1_000_002]
+    items = [
+        UserUpsert(id=sample_user.id, email=sample_user.email, name="Upserted User"),
+        *(UserUpsert(id=item_id, email=f"upsert{item_id}@example.com", name="New User") for item_id in new_ids),
+    ]
+
+    users = await user_crud.upsert(db, upserted_items=RootModel[Sequence[UserUpsert]](items), returning=True)
+
+    assert users is not None
+    assert {user.id: user.name for user in users} == {
+        sample_user.id: "Upserted User",
+        new_ids[0]: "New User",
+        new_ids[1]: "New User",
+    }
+    # Already loaded item reflects upserted values
+    assert sample_user.name == "Upserted User"
+
+    for item_id in new_ids:
+        await user_crud.delete(db, item_id)
+
+
+@pytest.mark.asyncio
+async def test_upsert_via_copy(user_crud: CRUD[User, UserCreate, UserPatch, UserUpsert]) -> None:
+    items = RootModel[Sequence[UserUpsert]](
+        [UserUpsert(id=i, email=f"copy{i}@example.com", name="Copy User") for i in range(2)],
+    )
+    db = RecordingPGSession()
+    pg_db = cast("AsyncSession", db)
+
+    # `COPY` is opt-in & only used for batches of at least `copy_threshold` items
+    await user_crud.upsert(pg_db, upserted_items=items)
+    await user_crud.upsert(pg_db, upserted_items=items, copy_threshold=3)
+    assert db.copied == []
+    assert db.compiled().startswith("INSERT INTO users (email, name, is_deleted, id) VALUES")
+
+    await user_crud.upsert(pg_db, upserted_items=items, update_cols=["name"], copy_threshold=2)
+    assert db.driver_sql[0] == "DROP TABLE IF EXISTS pg_temp._tmp_upsert_users"
+    assert db.driver_sql[1].startswith("CREATE TEMP TABLE _tmp_upsert_users ON COMMIT DROP AS SELECT email,")
+    assert db.copied == [
+        (
+            "_tmp_upsert_users",
+            "pg_temp",
+            [("copy0@example.com", "Copy User", 0), ("copy1@example.com", "Copy User", 1)],
+            ["email", "name", "id"],
+        ),
+    ]
+    # Python side defaults of columns missing in payload are applied via `INSERT ... SELECT`
+    assert db.compiled() == (
+        "INSERT INTO users (email, name, id, is_deleted) "
+        "SELECT pg_temp._tmp_upsert_users.email, pg_temp._tmp_upsert_users.name, pg_temp._tmp_upsert_users.id, "
+        "$1::BOOLEAN AS anon_1 "
+        "FROM pg_temp._tmp_upsert_users "
+        "ON CONFLICT (id) DO UPDATE SET name = excluded.name"
+    )
+
+
 # TODO: Why this test failing? Is our CRUD's upsert needs update?
 # @pytest.mark.asyncio
 # async def test_upsert(
@@ -53,3 +53,24 @@ async def test_single_query_count(app: FastAPI, async_engine: AsyncEngine):
         assert response.status_code == 200
         assert "X-DB-Query-Count" in response.headers
         assert response.headers["X-DB-Query-Count"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_query_count_across_engines(app: FastAPI, async_engine: AsyncEngine):
+    other_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    app.add_middleware(QueryCountMiddleware, engine=[async_engine, other_engine])
+
+    @app.get("/test-queries-across-engines")
+    async def test_queries_across_engines():
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        async with other_engine.connect() as conn:
+            await conn.execute(text("SELECT 2"))
+        return {"message": "ok"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get("/test-queries-across-engines")
+        assert response.status_code == 200
+        assert response.headers["X-DB-Query-Count"] == "2"
+
+    await other_engine.dispose()
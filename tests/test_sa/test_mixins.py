@@ -0,0 +1,62 @@
+import sqlalchemy
+from sqlalchemy import insert
+from sqlalchemy.orm import DeclarativeBase
+
+from fastapi_batteries.sa.mixins import MixinCreatedAt, MixinFactory, MixinId, MixinUpdatedAt
+
+
+class Base(DeclarativeBase): ...
+
+
+class Item(Base, MixinId, MixinCreatedAt, MixinUpdatedAt):
+    __tablename__ = "items"
+
+
+def test_timestamps_are_bound_on_core_insert() -> None:
+    # Columns with only `server_default` would be left out of INSERT
+    compiled = insert(Item).compile()
+    assert {"created_at", "updated_at"} <= compiled.binds.keys()
+
+    created_at_default = Item.__table__.c.created_at.default
+    assert created_at_default is not None
+    assert created_at_default.is_callable
+
+
+def test_renamed_mixin_is_reused() -> None:
+    mixin_started_at = MixinFactory.get_renamed(source_mixin=MixinCreatedAt, renamed_col="started_at")
+    assert MixinFactory.get_renamed(source_mixin=MixinCreatedAt, renamed_col="started_at") is mixin_started_at
+    assert MixinFactory.get_renamed(source_mixin=MixinCreatedAt, renamed_col="opened_at") is not mixin_started_at
+
+    class Task(Base, MixinId, mixin_started_at):
+        __tablename__ = "tasks"
+
+    class Job(Base, MixinId, mixin_started_at):
+        __tablename__ = "jobs"
+
+    # Each model gets its own column bound to its own table
+    task_col, job_col = Task.__table__.c.started_at, Job.__table__.c.started_at
+    assert task_col is not job_col
+    assert task_col.table is Task.__table__
+    assert job_col.table is Job.__table__
+
+
+def test_renamed_mixin_keeps_source_column_definition() -> None:
+    # NOTE: Renamed mixin copies column via SQLAlchemy's private `MappedColumn._copy` which is verified for this range
+    sqlalchemy_version = tuple(int(part) for part in sqlalchemy.__version__.split(".")[:2])
+    assert (2, 0) <= sqlalchemy_version < (2, 1), "Verify `_get_renamed` still copies columns with this SQLAlchemy"
+
+    mixin_closed_at = MixinFactory.get_renamed(source_mixin=MixinUpdatedAt, renamed_col="closed_at")
+
+    class Ticket(Base, MixinId, mixin_closed_at):
+        __tablename__ = "tickets"
+
+    source_col, renamed_col = Item.__table__.c.updated_at, Ticket.__table__.c.closed_at
+    assert renamed_col.name == "closed_at"
+    assert type(renamed_col.type) is type(source_col.type)
+    assert renamed_col.type.timezone is True
+    assert renamed_col.server_default is not None
+    assert renamed_col.default is not None
+    assert renamed_col.onupdate is not None
+
+    # Dataclass options (keyword only with `None` default) are kept as well
+    assert Ticket().closed_at is None
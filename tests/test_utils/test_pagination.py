@@ -1,6 +1,8 @@
 import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 
-from fastapi_batteries.utils.pagination import page_size_to_offset_limit
+from fastapi_batteries.utils.pagination import decode_cursor, encode_cursor, keyset_paginate, page_size_to_offset_limit
 
 
 def test_page_size_to_offset_limit():
@@ -32,3 +34,52 @@ def test_page_size_to_offset_limit_edge_cases():
 
     with pytest.raises(ValueError, match="Size must be greater than 0"):
         page_size_to_offset_limit(page=1, size=-1)
+
+
+def test_encode_decode_cursor():
+    """Test cursor round trip & invalid cursors."""
+    assert decode_cursor(encode_cursor(["John", 1])) == ["John", 1]
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor("invalid")
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        # Base64 encoded JSON object instead of array
+        decode_cursor("e30=")
+
+
+def test_keyset_paginate():
+    """Test keyset_paginate seeks past last seen value & tells next value only for full page."""
+
+    class Base(DeclarativeBase):
+        pass
+
+    class Item(Base):
+        __tablename__ = "items"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        db.add_all([Item(id=i) for i in range(1, 6)])
+        db.commit()
+
+        statement, get_next_value = keyset_paginate(select(Item).order_by(Item.id.desc()), order_col=Item.id, size=2)
+        items = db.scalars(statement).all()
+        assert [item.id for item in items] == [1, 2]
+        assert get_next_value(items) == 2
+
+        statement, get_next_value = keyset_paginate(
+            select(Item.id),
+            order_col=Item.id,
+            last_seen_value=4,
+            size=2,
+        )
+        rows = db.execute(statement).all()
+        assert [row.id for row in rows] == [5]
+        assert get_next_value(rows) is None
+
+    with pytest.raises(ValueError, match="Size must be greater than 0"):
+        keyset_paginate(select(Item), order_col=Item.id, size=0)